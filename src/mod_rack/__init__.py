@@ -37,6 +37,7 @@ from .plugin import Plugin, Port
 from .controls import (
     ControlPort,
     ControlProperties,
+    ControlKind,
     ScalePoint,
     Units,
     parse_control_ports,
@@ -97,6 +98,7 @@ __all__ = [
     "Port",
     # Controls
     "ControlProperties",
+    "ControlKind",
     "ScalePoint",
     "Units",
     "ControlPort",
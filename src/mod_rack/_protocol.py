@@ -0,0 +1,416 @@
+"""
+MOD-UI WebSocket protocol: event types and message parser.
+
+Pure string/number code with no I/O, kept in its own module so it can be
+compiled with mypyc for the per-message hot path:
+
+    mypyc src/mod_rack/_protocol.py
+
+The resulting extension module takes precedence over this file on import;
+without it the pure-Python version is used.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, ClassVar
+
+__all__ = [
+    "WsProtocol",
+    "PortType",
+    "PortDirection",
+    "WsEvent",
+    "PingEvent",
+    "StatsEvent",
+    "SysStatsEvent",
+    "LoadingStartEvent",
+    "LoadingEndEvent",
+    "RemoveAllEvent",
+    "ResetConnectionsEvent",
+    "TransportEvent",
+    "TrueBypassEvent",
+    "SizeEvent",
+    "PbSizeEvent",
+    "GraphAddHwPortEvent",
+    "GraphRemoveHwPortEvent",
+    "GraphConnectEvent",
+    "GraphDisconnectEvent",
+    "GraphParamSetEvent",
+    "GraphParamSetBypassEvent",
+    "GraphPluginPosEvent",
+    "GraphPluginAddEvent",
+    "GraphPluginRemoveEvent",
+    "UnknownEvent",
+]
+
+# Every instance/port path sent by MOD-UI starts with this prefix,
+# so parsers strip it by slicing instead of str.removeprefix().
+GRAPH_PREFIX = "/graph/"
+GRAPH_PREFIX_LEN = len(GRAPH_PREFIX)
+
+# Recently parsed float tokens (param values, positions).
+# Automation and knob sweeps repeat the same values, so most lookups hit.
+_FLOAT_CACHE_SIZE = 1024
+_float_cache: dict[str, float] = {}
+
+
+def _pfloat(s: str, _c: dict[str, float] = _float_cache) -> float:
+    """float(s) memoized for recently seen tokens. Raises ValueError like float()."""
+    v = _c.get(s)
+    if v is None:
+        v = float(s)
+        if len(_c) < _FLOAT_CACHE_SIZE:
+            _c[s] = v
+    return v
+
+
+# -----------------------------
+# Event dataclasses
+# -----------------------------
+
+
+@dataclass(frozen=True)
+class PingEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class StatsEvent:
+    _a: float = field(compare=False)
+    _b: int = field(compare=False)
+
+
+@dataclass(frozen=True)
+class SysStatsEvent:
+    _a: float = field(compare=False)
+    _b: int = field(compare=False)
+    _c: int = field(compare=False)
+
+
+@dataclass(frozen=True)
+class LoadingStartEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class LoadingEndEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class RemoveAllEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class ResetConnectionsEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class TransportEvent:
+    _any: Any
+
+
+@dataclass(frozen=True)
+class TrueBypassEvent:
+    _a: int
+    _b: int
+
+
+@dataclass(frozen=True)
+class SizeEvent:
+    _a: int
+    _b: int
+
+
+@dataclass(frozen=True)
+class PbSizeEvent:
+    x: int
+    y: int
+
+
+class PortType(Enum):
+    AUDIO = "audio"
+    MIDI = "midi"
+
+
+class PortDirection(Enum):
+    INPUT = "0"
+    OUTPUT = "1"
+
+
+@dataclass(frozen=True)
+class GraphAddHwPortEvent:
+    name: str
+    port_type: PortType
+    direction: PortDirection
+
+
+@dataclass(frozen=True)
+class GraphRemoveHwPortEvent:
+    name: str
+
+
+@dataclass(frozen=True)
+class GraphConnectEvent:
+    """connect /graph/gx_duck_delay__ND258bdR/out /graph/gx_fuzz__4e4UwTyJ/in"""
+
+    src_path: str
+    dst_path: str
+
+
+@dataclass(frozen=True)
+class GraphDisconnectEvent:
+    """disconnect /graph/gx_duck_delay__ND258bdR/out /graph/gx_fuzz__4e4UwTyJ/in"""
+
+    src_path: str
+    dst_path: str
+
+
+# High-frequency events are hand-written instead of @dataclass(frozen=True):
+# StateSnapshot hashes every incoming event, and the generated __hash__/__eq__
+# build a tuple of the compared fields on each call.
+
+
+class GraphParamSetEvent:
+    __slots__ = ("label", "symbol", "value")
+    __match_args__ = ("label", "symbol", "value")
+
+    def __init__(self, label: str, symbol: str, value: float) -> None:
+        self.label = label
+        self.symbol = symbol
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not GraphParamSetEvent:
+            return NotImplemented
+        return self.label == other.label and self.symbol == other.symbol
+
+    def __hash__(self) -> int:
+        return hash(self.label) ^ hash(self.symbol)
+
+    def __repr__(self) -> str:
+        return (
+            f"GraphParamSetEvent(label={self.label!r}, "
+            f"symbol={self.symbol!r}, value={self.value!r})"
+        )
+
+
+class GraphParamSetBypassEvent:
+    __slots__ = ("label", "bypassed")
+    __match_args__ = ("label", "bypassed")
+
+    def __init__(self, label: str, bypassed: bool) -> None:
+        self.label = label
+        self.bypassed = bypassed
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not GraphParamSetBypassEvent:
+            return NotImplemented
+        return self.label == other.label
+
+    def __hash__(self) -> int:
+        return hash(self.label)
+
+    def __repr__(self) -> str:
+        return (
+            f"GraphParamSetBypassEvent(label={self.label!r}, "
+            f"bypassed={self.bypassed!r})"
+        )
+
+
+class GraphPluginPosEvent:
+    __slots__ = ("label", "x", "y")
+    __match_args__ = ("label", "x", "y")
+
+    def __init__(self, label: str, x: float, y: float) -> None:
+        self.label = label
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not GraphPluginPosEvent:
+            return NotImplemented
+        return self.label == other.label
+
+    def __hash__(self) -> int:
+        return hash(self.label)
+
+    def __repr__(self) -> str:
+        return f"GraphPluginPosEvent(label={self.label!r}, x={self.x!r}, y={self.y!r})"
+
+
+@dataclass(frozen=True)
+class UnknownEvent:
+    msg_type: str
+    raw_message: str
+
+
+@dataclass(frozen=True)
+class GraphPluginAddEvent:
+    label: str
+    uri: str = field(compare=False)
+    x: float = field(compare=False, default=0)
+    y: float = field(compare=False, default=0)
+
+
+@dataclass(frozen=True)
+class GraphPluginRemoveEvent:
+    label: str
+
+
+# --------------------
+# Union of all possible events
+WsEvent = (
+    PingEvent
+    | StatsEvent
+    | SysStatsEvent
+    | LoadingStartEvent
+    | LoadingEndEvent
+    | RemoveAllEvent
+    | ResetConnectionsEvent
+    | TransportEvent
+    | TrueBypassEvent
+    | SizeEvent
+    | PbSizeEvent
+    | GraphAddHwPortEvent
+    | GraphRemoveHwPortEvent
+    | GraphConnectEvent
+    | GraphDisconnectEvent
+    | GraphParamSetEvent
+    | GraphParamSetBypassEvent
+    | GraphPluginPosEvent
+    | GraphPluginAddEvent
+    | GraphPluginRemoveEvent
+    | UnknownEvent
+)
+
+
+# -----------------------------
+# Protocol
+# -----------------------------
+class WsProtocol:
+    GRAPH_PREFIX: ClassVar[str] = GRAPH_PREFIX
+
+    @staticmethod
+    def parse(message: str) -> WsEvent | None:
+        parts: list[str] = message.split()
+        n = GRAPH_PREFIX_LEN
+
+        match parts:
+            # param_set dominates the stream, so it is matched first:
+            # cases are tried in order and it used to be the last one.
+            case ["param_set", inst, symbol, val, *_]:
+                try:
+                    f_val = _pfloat(val)
+                except ValueError:
+                    return None
+                label = inst[n:]
+                if symbol == ":bypass":
+                    return GraphParamSetBypassEvent(label=label, bypassed=f_val > 0.5)
+                return GraphParamSetEvent(label=label, symbol=symbol, value=f_val)
+
+            case ["ping", *_]:
+                return PingEvent()
+
+            case ["stats", _a, _b, *_]:
+                try:
+                    return StatsEvent(float(_a), int(_b))
+                except ValueError:
+                    pass
+
+            case ["sys_stats", _a, _b, _c, *_]:
+                try:
+                    return SysStatsEvent(float(_a), int(_b), int(_c))
+                except ValueError:
+                    pass
+
+            case ["loading_start", *_]:
+                # received 2 values like (1, 1) but we ignoring it
+                return LoadingStartEvent()
+
+            case ["loading_end", *_]:
+                # received 2 values like (0, 0) but we ignoring it
+                return LoadingEndEvent()
+
+            # audio port
+            case ["add_hw_port", instance, "audio" | "midi" as typ, dir_, *_]:
+                try:
+                    return GraphAddHwPortEvent(
+                        name=sys.intern(instance[n:]),
+                        port_type=PortType(typ),
+                        direction=PortDirection(dir_),
+                    )
+                except ValueError as e:
+                    print(e)
+                    return None
+
+            case ["remove_hw_port", instance, *_]:
+                return GraphRemoveHwPortEvent(name=instance[n:])
+
+            # plugin_pos /graph/label x y
+            case ["plugin_pos", inst, rx, ry, *_]:
+                try:
+                    x: float = _pfloat(rx)
+                    y: float = _pfloat(ry)
+                    return GraphPluginPosEvent(label=inst[n:], x=x, y=y)
+                except ValueError:
+                    None
+
+            case ["add", inst, uri, rx, ry, *_]:
+                try:
+                    x, y = _pfloat(rx), _pfloat(ry)
+                except ValueError:
+                    x, y = 0.0, 0.0
+                return GraphPluginAddEvent(inst[n:], uri, x, y)
+
+            case ["add", inst, uri, *_]:
+                return GraphPluginAddEvent(inst[n:], uri, 0, 0)
+
+            case ["remove", ":all"]:
+                return RemoveAllEvent()
+
+            case ["remove", inst, *_]:
+                # remove /graph/label
+                return GraphPluginRemoveEvent(inst[n:])
+
+            case ["connect" | "disconnect" as action, src, dst, *_]:
+                event_cls = (
+                    GraphConnectEvent if action == "connect" else GraphDisconnectEvent
+                )
+                # interned: the same port paths recur in Orchestrator._connections
+                # and the computed routing, so set lookups compare by identity
+                return event_cls(
+                    sys.intern(src[n:]),
+                    sys.intern(dst[n:]),
+                )
+
+            case ["resetConnections", *_]:
+                return ResetConnectionsEvent()
+
+            case ["transport", *_any]:
+                TransportEvent(_any)
+
+            case ["true_bypass", _a, _b, *_]:
+                try:
+                    return TrueBypassEvent(int(_a), int(_b))
+                except ValueError:
+                    return None
+
+            case ["size", _a, _b, *_]:
+                try:
+                    SizeEvent(int(_a), int(_b))
+                except ValueError:
+                    return None
+
+            case ["pb_size", rx, ry, *_]:
+                try:
+                    return PbSizeEvent(int(rx), int(ry))
+                except ValueError:
+                    return None
+
+            case [msg_type, *_]:
+                print("UnknownEvent", msg_type, message)
+                return UnknownEvent(msg_type=msg_type, raw_message=message)
+        return None
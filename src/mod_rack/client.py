@@ -1,16 +1,61 @@
 from collections import defaultdict
-from dataclasses import dataclass, field
-from enum import Enum
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
 import struct
 import time
 import threading
 import weakref
-from typing import Any, Callable, Protocol, Type, TypeAlias, TypeVar, cast
-from urllib.parse import unquote, urlparse
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Mapping,
+    Protocol,
+    Type,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+from urllib.parse import unquote
 
 import requests
 import websocket
 
+try:
+    from orjson import loads as json_loads  # type: ignore[import-not-found]  # optional: pip install orjson
+except ImportError:
+    from json import loads as json_loads
+
+from mod_rack._protocol import (
+    GraphAddHwPortEvent,
+    GraphConnectEvent,
+    GraphDisconnectEvent,
+    GraphParamSetBypassEvent,
+    GraphParamSetEvent,
+    GraphPluginAddEvent,
+    GraphPluginPosEvent,
+    GraphPluginRemoveEvent,
+    GraphRemoveHwPortEvent,
+    LoadingEndEvent,
+    LoadingStartEvent,
+    PbSizeEvent,
+    PingEvent,
+    PortDirection,
+    PortType,
+    RemoveAllEvent,
+    ResetConnectionsEvent,
+    SizeEvent,
+    StatsEvent,
+    SysStatsEvent,
+    TransportEvent,
+    TrueBypassEvent,
+    UnknownEvent,
+    WsEvent,
+    WsProtocol,
+)
+
 __all__ = [
     # Client
     "Client",
@@ -48,185 +93,45 @@ __all__ = [
     "UnknownEvent",
 ]
 
+log = logging.getLogger(__name__)
+
 HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "User-Agent": "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0",
 }
+POST_HEADERS = {**HEADERS, "Content-Type": "text/plain"}
 
-# Messages to ignore (stats, system info)
-IGNORE_MESSAGES = frozenset(["stats", "sys_stats", "ping"])
-
-
-# -----------------------------
-# Event dataclasses
-# -----------------------------
-
-
-@dataclass(frozen=True)
-class PingEvent:
-    pass
-
-
-@dataclass(frozen=True)
-class StatsEvent:
-    _a: float = field(compare=False)
-    _b: int = field(compare=False)
-
-
-@dataclass(frozen=True)
-class SysStatsEvent:
-    _a: float = field(compare=False)
-    _b: int = field(compare=False)
-    _c: int = field(compare=False)
-
-
-@dataclass(frozen=True)
-class LoadingStartEvent:
-    pass
-
-
-@dataclass(frozen=True)
-class LoadingEndEvent:
-    pass
-
-
-@dataclass(frozen=True)
-class RemoveAllEvent:
-    pass
-
-
-@dataclass(frozen=True)
-class ResetConnectionsEvent:
-    pass
-
-
-@dataclass(frozen=True)
-class TransportEvent:
-    _any: Any
-
-
-@dataclass(frozen=True)
-class TrueBypassEvent:
-    _a: int
-    _b: int
-
-
-@dataclass(frozen=True)
-class SizeEvent:
-    _a: int
-    _b: int
-
-
-@dataclass(frozen=True)
-class PbSizeEvent:
-    x: int
-    y: int
-
-
-class PortType(Enum):
-    AUDIO = "audio"
-    MIDI = "midi"
+# Max distinct plugin URIs kept in the effect metadata caches
+EFFECT_CACHE_SIZE = 256
 
+# Bytes a JSON document can start with (object, array, string, number,
+# true/false/null); anything else in a response body is plain text
+_JSON_FIRST_BYTES = b'{["-0123456789tfn'
 
-class PortDirection(Enum):
-    INPUT = "0"
-    OUTPUT = "1"
-
-
-@dataclass(frozen=True)
-class GraphAddHwPortEvent:
-    name: str
-    port_type: PortType
-    direction: PortDirection
-
-
-@dataclass(frozen=True)
-class GraphRemoveHwPortEvent:
-    name: str
-
-
-@dataclass(frozen=True)
-class GraphConnectEvent:
-    """connect /graph/gx_duck_delay__ND258bdR/out /graph/gx_fuzz__4e4UwTyJ/in"""
-
-    src_path: str
-    dst_path: str
-
-
-@dataclass(frozen=True)
-class GraphDisconnectEvent:
-    """disconnect /graph/gx_duck_delay__ND258bdR/out /graph/gx_fuzz__4e4UwTyJ/in"""
-
-    src_path: str
-    dst_path: str
-
-
-@dataclass(frozen=True)
-class GraphParamSetEvent:
-    label: str
-    symbol: str
-    value: float = field(compare=False)
-
-
-@dataclass(frozen=True)
-class GraphParamSetBypassEvent:
-    label: str
-    bypassed: bool = field(compare=False)
-
-
-@dataclass(frozen=True)
-class GraphPluginPosEvent:
-    label: str
-    x: float = field(compare=False)
-    y: float = field(compare=False)
-
-
-@dataclass(frozen=True)
-class UnknownEvent:
-    msg_type: str
-    raw_message: str
-
+# Messages to ignore (stats, system info)
+IGNORE_MESSAGES = frozenset(["stats", "sys_stats", "ping"])
 
-@dataclass(frozen=True)
-class GraphPluginAddEvent:
-    label: str
-    uri: str = field(compare=False)
-    x: float = field(compare=False, default=0)
-    y: float = field(compare=False, default=0)
 
+def _split_hostport(url: str) -> tuple[str, str, int | None]:
+    """Split "scheme://host:port/path" into (scheme, host, port).
 
-@dataclass(frozen=True)
-class GraphPluginRemoveEvent:
-    label: str
+    Scheme defaults to "http" and port to None when missing.
+    """
+    i = url.find("://")
+    if i != -1:
+        scheme, rest = url[:i], url[i + 3 :]
+    else:
+        scheme, rest = "http", url
+    hostport, _, _ = rest.partition("/")
+    host, _, port = hostport.partition(":")
+    return scheme.lower(), host.lower(), int(port) if port else None
 
 
-# --------------------
-# Union of all possible events
-WsEvent = (
-    PingEvent
-    | StatsEvent
-    | SysStatsEvent
-    | LoadingStartEvent
-    | LoadingEndEvent
-    | RemoveAllEvent
-    | ResetConnectionsEvent
-    | TransportEvent
-    | TrueBypassEvent
-    | SizeEvent
-    | PbSizeEvent
-    | GraphAddHwPortEvent
-    | GraphRemoveHwPortEvent
-    | GraphConnectEvent
-    | GraphDisconnectEvent
-    | GraphParamSetEvent
-    | GraphParamSetBypassEvent
-    | GraphPluginPosEvent
-    | GraphPluginAddEvent
-    | GraphPluginRemoveEvent
-    | UnknownEvent
-)
-
+# -----------------------------
+# Callbacks
+# -----------------------------
 WsEventT = TypeVar("WsEventT", bound=WsEvent, covariant=True)
+_ResultT = TypeVar("_ResultT")
 
 
 class EventCallBack(Protocol[WsEventT]):
@@ -238,132 +143,22 @@ EventCallBackRef: TypeAlias = (
 )
 
 
-# -----------------------------
-# Protocol
-# -----------------------------
-class WsProtocol:
-    GRAPH_PREFIX = "/graph/"
-
-    @staticmethod
-    def parse(message: str) -> WsEvent | None:
-        parts: list[str] = message.split()
-        prefix = WsProtocol.GRAPH_PREFIX
-
-        match parts:
-            case ["ping", *_]:
-                return PingEvent()
-
-            case ["stats", _a, _b, *_]:
-                try:
-                    return StatsEvent(float(_a), int(_b))
-                except ValueError:
-                    pass
-
-            case ["sys_stats", _a, _b, _c, *_]:
-                try:
-                    return SysStatsEvent(float(_a), int(_b), int(_c))
-                except ValueError:
-                    pass
-
-            case ["loading_start", *_]:
-                # received 2 values like (1, 1) but we ignoring it
-                return LoadingStartEvent()
-
-            case ["loading_end", *_]:
-                # received 2 values like (0, 0) but we ignoring it
-                return LoadingEndEvent()
-
-            # audio port
-            case ["add_hw_port", instance, "audio" | "midi" as typ, dir_, *_]:
-                try:
-                    return GraphAddHwPortEvent(
-                        name=instance.removeprefix(prefix),
-                        port_type=PortType(typ),
-                        direction=PortDirection(dir_),
-                    )
-                except ValueError as e:
-                    print(e)
-                    return None
-
-            case ["remove_hw_port", instance, *_]:
-                return GraphRemoveHwPortEvent(name=instance.removeprefix(prefix))
-
-            # plugin_pos /graph/label x y
-            case ["plugin_pos", inst, rx, ry, *_]:
-                try:
-                    x: float = float(rx)
-                    y: float = float(ry)
-                    return GraphPluginPosEvent(
-                        label=inst.removeprefix(prefix), x=x, y=y
-                    )
-                except ValueError:
-                    None
-
-            case ["add", inst, uri, rx, ry, *_]:
-                try:
-                    x, y = float(rx), float(ry)
-                except ValueError:
-                    x, y = 0, 0
-                return GraphPluginAddEvent(inst.removeprefix(prefix), uri, x, y)
-
-            case ["add", inst, uri, *_]:
-                return GraphPluginAddEvent(inst.removeprefix(prefix), uri, 0, 0)
-
-            case ["remove", ":all"]:
-                return RemoveAllEvent()
-
-            case ["remove", inst, *_]:
-                # remove /graph/label
-                return GraphPluginRemoveEvent(inst.removeprefix(prefix))
-
-            case ["connect" | "disconnect" as action, src, dst, *_]:
-                event_cls = (
-                    GraphConnectEvent if action == "connect" else GraphDisconnectEvent
-                )
-                return event_cls(
-                    src.removeprefix(prefix),
-                    dst.removeprefix(prefix),
-                )
-
-            case ["resetConnections", *_]:
-                return ResetConnectionsEvent()
-
-            case ["transport", *_any]:
-                TransportEvent(_any)
-
-            case ["true_bypass", _a, _b, *_]:
-                try:
-                    return TrueBypassEvent(int(_a), int(_b))
-                except ValueError:
-                    return None
-
-            case ["size", _a, _b, *_]:
-                try:
-                    SizeEvent(int(_a), int(_b))
-                except ValueError:
-                    return None
-
-            case ["pb_size", rx, ry, *_]:
-                try:
-                    return PbSizeEvent(int(rx), int(ry))
-                except ValueError:
-                    return None
-
-            case ["param_set", inst, symbol, val, *_]:
-                try:
-                    f_val = float(val)
-                except ValueError:
-                    return None
-                label = inst.removeprefix(prefix)
-                if symbol == ":bypass":
-                    return GraphParamSetBypassEvent(label=label, bypassed=f_val > 0.5)
-                return GraphParamSetEvent(label=label, symbol=symbol, value=f_val)
-            case [msg_type, *_]:
-                print("UnknownEvent", msg_type, message)
-                return UnknownEvent(msg_type=msg_type, raw_message=message)
-        return None
+def _callback_ref(
+    cb: EventCallBack, on_dead: Callable[[Any], None] | None = None
+) -> EventCallBackRef:
+    """Weak reference to a callback: WeakMethod for bound methods, ref otherwise.
 
+    on_dead is called with the ref once its target is collected.
+    """
+    try:
+        return weakref.WeakMethod(cb, on_dead)  # type: ignore[arg-type] # bound method
+    except TypeError:
+        return weakref.ref(cb, on_dead)
 
+
+# -----------------------------
+# Transport
+# -----------------------------
 class WsConnection:
     def __init__(
         self,
@@ -503,6 +298,16 @@ class StateSnapshot:
                 if not events_dict:
                     del self._events[type(event)]
 
+    def remove_label(self, label: str):
+        """Видалити всі події, адресовані label (плагін прибрано з графа)"""
+        with self._lock:
+            for event_type, events_dict in list(self._events.items()):
+                stale = [e for e in events_dict if getattr(e, "label", None) == label]
+                for event in stale:
+                    del events_dict[event]
+                if not events_dict:
+                    del self._events[event_type]
+
     def clear(self):
         """Очистити всі події"""
         with self._lock:
@@ -514,17 +319,21 @@ class StateSnapshot:
             # Повертає впорядкований список унікальних за структурою подій
             return list(self._events.get(event_type, {}).keys())
 
+    def snapshot(self, event_type: Type) -> tuple:
+        """Immutable copy of events of given type, for iterating outside the lock."""
+        with self._lock:
+            return tuple(self._events.get(event_type, ()))
+
 
 # -----------------------------
 # WsClient
 # -----------------------------
 class WsClient:
     def __init__(self, base_url: str):
-        parsed = urlparse(base_url)
-        is_secure = parsed.scheme == "https"
+        scheme, hostname, port = _split_hostport(base_url)
+        is_secure = scheme == "https"
         scheme = "wss" if is_secure else "ws"
-        hostname = parsed.hostname or parsed.path.split(":")[0]
-        port = parsed.port or (443 if is_secure else 18181)
+        port = port or (443 if is_secure else 18181)
         self.ws_url = f"{scheme}://{hostname}:{port}/websocket"
         print("WS:", self.ws_url)
 
@@ -533,6 +342,13 @@ class WsClient:
         self._listeners: defaultdict[Type[WsEvent], set[EventCallBackRef]] = (
             defaultdict(set)
         )
+        # Immutable per-type copies of _listeners used by _dispatch, so the
+        # hot path skips the lock and list copy. Dropped on every change.
+        self._dispatch_cache: dict[Type[WsEvent], tuple[EventCallBackRef, ...]] = {}
+        # Label-addressed listeners {event_type: {label: ref}}, routed in O(1)
+        self._label_listeners: defaultdict[
+            Type[WsEvent], dict[str, EventCallBackRef]
+        ] = defaultdict(dict)
         self._lock = threading.RLock()
 
         # Transport
@@ -545,20 +361,15 @@ class WsClient:
         )
 
     def on(self, event_type: Type[WsEventT], cb: Callable[[WsEventT], None]):
-        ref: EventCallBackRef
-        cb_any = cast(EventCallBack, cb)
         key = cast(type[WsEvent], event_type)
-
-        try:
-            ref = weakref.WeakMethod(cb_any)  # type: ignore[arg-type] # bound method
-        except TypeError:
-            ref = weakref.ref(cb_any)
+        ref = _callback_ref(cast(EventCallBack, cb))
 
         with self._lock:
             self._listeners[key].add(ref)
+            self._dispatch_cache.pop(key, None)
 
         # replay state (type-safe)
-        for event in self._state[event_type]:
+        for event in self._state.snapshot(event_type):
             cb(event)
 
     def off(self, event_type: Type[WsEventT], cb: Callable[[WsEventT], None]):
@@ -573,13 +384,81 @@ class WsClient:
             for ref in list(refs):
                 if ref() is cb_any:
                     refs.remove(ref)
+            self._dispatch_cache.pop(key, None)
 
-    def _dispatch(self, event: WsEvent):
-        # add event to local state
-        self._state.add(event)
+    def on_label(
+        self,
+        event_type: Type[WsEventT],
+        label: str,
+        cb: Callable[[WsEventT], None],
+        replay: bool = True,
+    ):
+        """
+        Subscribe to events of given type addressed to one label.
+
+        Events are routed by a dict lookup instead of calling every listener,
+        so per-plugin handlers cost O(1) per event regardless of rack size.
+        One callback per (event_type, label); a new one replaces the old.
+        """
+        key = cast(type[WsEvent], event_type)
+        listeners = self._label_listeners[key]
+
+        def _drop(dead_ref):
+            # owner collected: free the slot now instead of on its next event
+            with self._lock:
+                if listeners.get(label) is dead_ref:
+                    del listeners[label]
+
+        ref = _callback_ref(cast(EventCallBack, cb), _drop)
 
         with self._lock:
-            refs = list(self._listeners.get(type(event), ()))
+            listeners[label] = ref
+
+        if not replay:
+            return
+
+        # replay state for this label only
+        for event in self._state.snapshot(event_type):
+            if getattr(event, "label", None) == label:
+                cb(event)
+
+    def on_labels(
+        self,
+        event_type: Type[WsEventT],
+        handlers: Mapping[str, Callable[[WsEventT], None]],
+    ):
+        """on_label for many labels at once: one lock, one state replay pass."""
+        with self._lock:
+            for label, cb in handlers.items():
+                self.on_label(event_type, label, cb, replay=False)
+
+        for event in self._state.snapshot(event_type):
+            handler = handlers.get(getattr(event, "label", ""))
+            if handler is not None:
+                handler(event)
+
+    def off_label(self, event_type: Type[WsEventT], label: str):
+        key = cast(type[WsEvent], event_type)
+        with self._lock:
+            listeners = self._label_listeners.get(key)
+            if listeners:
+                listeners.pop(label, None)
+
+    def _dispatch(self, event: WsEvent):
+        event_type = type(event)
+
+        # add event to local state; a removed plugin takes its history with
+        # it, so add/pos/param events of dead labels neither pile up in long
+        # sessions nor get replayed to late subscribers
+        if isinstance(event, GraphPluginRemoveEvent):
+            self._state.remove_label(event.label)
+        else:
+            self._state.add(event)
+        refs = self._dispatch_cache.get(event_type)
+        if refs is None:
+            with self._lock:
+                refs = tuple(self._listeners.get(event_type, ()))
+                self._dispatch_cache[event_type] = refs
 
         dead: list[EventCallBackRef] = []
 
@@ -592,7 +471,21 @@ class WsClient:
 
         if dead:
             with self._lock:
-                self._listeners[type(event)].difference_update(dead)
+                self._listeners[event_type].difference_update(dead)
+                self._dispatch_cache.pop(event_type, None)
+
+        by_label = self._label_listeners.get(event_type)
+        if by_label:
+            label: str = getattr(event, "label", "")
+            label_ref = by_label.get(label)
+            if label_ref is not None:
+                cb = label_ref()
+                if cb is None:
+                    with self._lock:
+                        if by_label.get(label) is label_ref:
+                            del by_label[label]
+                else:
+                    cb(event)
 
     # -------------------
     # WsConnection callbacks
@@ -649,6 +542,9 @@ class WsClient:
 # Client
 # -----------------------------
 class Client:
+    # mod-ui has no batch endpoint: *_many helpers pipeline this many requests
+    BATCH_WORKERS = 8
+
     def __init__(self, base_url: str):
         """
         Client for MOD server.
@@ -660,6 +556,21 @@ class Client:
                      installing callbacks to avoid missing early WS messages.
         """
         self.base_url = base_url
+
+        # Prebuilt URLs for per-label graph endpoints (called at UI rate)
+        self._effect_add_url = base_url + "/effect/add//graph/"
+        self._effect_remove_url = base_url + "/effect/remove//graph/"
+        self._effect_connect_url = base_url + "/effect/connect//graph/"
+        self._effect_disconnect_url = base_url + "/effect/disconnect//graph/"
+        self._effect_position_url = base_url + "/effect/position//graph/"
+        self._effect_param_set_url = base_url + "/effect/parameter/set/"
+
+        # Effect metadata is static per URI: memoize it across instances
+        self._effect_cache: dict[str, MappingProxyType[str, Any]] = {}
+        self._image_size_cache: dict[tuple[str, str], tuple[int, int]] = {}
+        self._effect_pending: dict[str, Future] = {}
+        self._cache_lock = threading.Lock()
+
         self.version = self._get_version()
 
         self.plugins_list: list[dict] = []
@@ -685,7 +596,10 @@ class Client:
         self.plugins_list = data if isinstance(data, list) else []
 
     def _get(self, path: str, **kwargs):
-        url = self.base_url + path
+        return self._get_url(self.base_url + path, **kwargs)
+
+    def _get_url(self, url: str, **kwargs):
+        """GET request to an absolute URL."""
         print(f"GET {url}")
         if kwargs:
             print(f"    params: {kwargs}")
@@ -694,14 +608,14 @@ class Client:
         return self._parse_response(resp)
 
     def _post(self, path: str, payload: str):
-        """POST request with text/plain payload."""
-        url = self.base_url + path
+        return self._post_url(self.base_url + path, payload)
+
+    def _post_url(self, url: str, payload: str):
+        """POST request with text/plain payload to an absolute URL."""
         print(f"POST {url}")
         print(f"    payload: {payload}")
 
-        resp = requests.post(
-            url, data=payload, headers={**HEADERS, "Content-Type": "text/plain"}
-        )
+        resp = requests.post(url, data=payload, headers=POST_HEADERS)
         return self._parse_response(resp)
 
     def _parse_response(self, resp: requests.Response):
@@ -717,25 +631,32 @@ class Client:
             data = resp.content
             return data
 
-        # 2. Обробка тексту та JSON
+        # 2. Булеві відповіді — порівнюємо сирі байти, без декодування
+        body = resp.content.strip()
+        if len(body) <= 5:
+            flag = body.lower()
+            if flag == b"true":
+                print("    OK: True")
+                return True
+            if flag == b"false":
+                print("    OK: False")
+                return False
+
+        # 3. JSON — сервер віддає і голі числа/рядки без JSON Content-Type,
+        # тож дивимось на перший байт; звичайний текст не парсимо взагалі
+        if body and ("json" in content_type or body[:1] in _JSON_FIRST_BYTES):
+            try:
+                data = json_loads(body)
+                print(f"    OK: {type(data).__name__}")
+                return data
+            except ValueError:
+                pass
+
+        # 4. Якщо це не JSON, повертаємо текст або None
         text = resp.text.strip()
-
-        if text.lower() == "true":
-            print("    OK: True")
-            return True
-        if text.lower() == "false":
-            print("    OK: False")
-            return False
-
-        try:
-            data = resp.json()
-            print(f"    OK: {type(data).__name__}")
-            return data
-        except (requests.exceptions.JSONDecodeError, ValueError):
-            # Якщо це не JSON, повертаємо текст або None
-            display_text = text[:50].replace("\n", " ")
-            print(f"    OK: {display_text}..." if len(text) > 50 else f"    OK: {text}")
-            return text if text else None
+        display_text = text[:50].replace("\n", " ")
+        print(f"    OK: {display_text}..." if len(text) > 50 else f"    OK: {text}")
+        return text if text else None
 
     # =========================================================================
     # Effects API
@@ -758,6 +679,35 @@ class Client:
         """Отримати детальну інформацію про ефект"""
         return self._get("/effect/get", uri=uri, version=self.version)
 
+    def effect_get_cached(self, uri: str) -> MappingProxyType[str, Any] | None:
+        """effect_get, memoized per URI (read-only view, shared between calls)"""
+        with self._cache_lock:
+            data = self._effect_cache.get(uri)
+            if data is not None:
+                return data
+            # Concurrent loads of one URI wait on the first request
+            pending = self._effect_pending.get(uri)
+            if pending is None:
+                future: Future = Future()
+                self._effect_pending[uri] = future
+        if pending is not None:
+            return pending.result()
+
+        data = None
+        try:
+            result = self.effect_get(uri)
+            if isinstance(result, dict):  # не кешуємо помилки
+                data = MappingProxyType(result)
+        finally:
+            with self._cache_lock:
+                if data is not None:
+                    if len(self._effect_cache) >= EFFECT_CACHE_SIZE:
+                        self._effect_cache.pop(next(iter(self._effect_cache)))
+                    self._effect_cache[uri] = data
+                del self._effect_pending[uri]
+            future.set_result(data)
+        return data
+
     def effect_image(self, uri: str, filename: str = "screenshot.png"):
         """Отримати скріншот ефекту"""
         return self._get(f"/effect/image/{filename}", uri=uri)
@@ -793,32 +743,82 @@ class Client:
         finally:
             return w, h
 
+    def effect_image_size_cached(
+        self, uri: str, filename: str = "screenshot.png"
+    ) -> tuple[int, int]:
+        """effect_image_size, memoized per (URI, filename)"""
+        key = (uri, filename)
+        size = self._image_size_cache.get(key)
+        if size is not None:
+            return size
+        size = self.effect_image_size(uri, filename)
+        if size != (0, 0):
+            with self._cache_lock:
+                if len(self._image_size_cache) >= EFFECT_CACHE_SIZE:
+                    self._image_size_cache.pop(next(iter(self._image_size_cache)))
+                self._image_size_cache[key] = size
+        return size
+
     def effect_add(
         self, label: str, uri: str, x: int = 200, y: int = 400
     ) -> dict | None:
         """Додати ефект на граф"""
-        return self._get(f"/effect/add//graph/{label}", uri=uri, x=x, y=y)
+        return self._get_url(self._effect_add_url + label, uri=uri, x=x, y=y)
 
     def effect_remove(self, label: str) -> bool:
         """Видалити ефект з графа"""
-        result = self._get(f"/effect/remove//graph/{label}")
+        result = self._get_url(self._effect_remove_url + label)
         return result is True
 
     def effect_connect(self, output: str, input: str) -> bool:
         """З'єднати два порти"""
-        result = self._get(f"/effect/connect//graph/{output},/graph/{input}")
+        result = self._get_url(f"{self._effect_connect_url}{output},/graph/{input}")
         return result is True
 
     def effect_disconnect(self, output: str, input: str) -> bool:
         """Роз'єднати два порти"""
-        result = self._get(f"/effect/disconnect//graph/{output},/graph/{input}")
+        result = self._get_url(f"{self._effect_disconnect_url}{output},/graph/{input}")
         return result is True
 
+    def _map_concurrent(
+        self, fn: Callable[..., _ResultT], args: Collection[tuple]
+    ) -> list[_ResultT]:
+        """Call fn(*a) for each a with overlapping round-trips; results in order."""
+        if len(args) <= 1:
+            return [fn(*a) for a in args]
+        with ThreadPoolExecutor(min(self.BATCH_WORKERS, len(args))) as ex:
+            return list(ex.map(lambda a: fn(*a), args))
+
+    def effect_remove_many(self, labels: Iterable[str]) -> list[bool]:
+        """Видалити кілька ефектів (запити йдуть паралельно)"""
+        return self._map_concurrent(self.effect_remove, [(label,) for label in labels])
+
+    def effect_connect_many(self, pairs: Collection[tuple[str, str]]) -> list[bool]:
+        """З'єднати кілька пар портів (запити йдуть паралельно)"""
+        return self._map_concurrent(self.effect_connect, pairs)
+
+    def effect_disconnect_many(self, pairs: Collection[tuple[str, str]]) -> list[bool]:
+        """Роз'єднати кілька пар портів (запити йдуть паралельно).
+
+        A pair whose request fails counts as not disconnected (False),
+        so one network error does not hide the results of the others.
+        """
+        return self._map_concurrent(self._effect_disconnect_checked, pairs)
+
+    def _effect_disconnect_checked(self, output: str, input: str) -> bool:
+        try:
+            return self.effect_disconnect(output, input)
+        except (OSError, requests.RequestException) as e:
+            log.warning("Disconnect %s -> %s failed: %s", output, input, e)
+            return False
+
     def effect_bypass(self, label, bypass: bool) -> Any:
         return self.effect_param_set(label, ":bypass", 1 if bypass else 0)
 
     def effect_param_set(self, label: str, symbol: str, value: Any):
-        return self._post("/effect/parameter/set/", f"/graph/{label}/{symbol}/{value}")
+        return self._post_url(
+            self._effect_param_set_url, f"/graph/{label}/{symbol}/{value}"
+        )
 
     def effect_preset_load(self, label: str, preset_uri: str):
         """Завантажити пресет для ефекту"""
@@ -834,7 +834,32 @@ class Client:
             print(f"  WebSocket position failed, using REST fallback: {e}")
 
         # Fallback to REST endpoint
-        return self._get(f"/effect/position//graph/{label}/{x}/{y}")
+        return self._get_url(f"{self._effect_position_url}{label}/{x}/{y}")
+
+    def effect_position_many(self, items: Iterable[tuple[str, float, float]]) -> None:
+        """Змінити позиції кількох ефектів.
+
+        WS plugin_pos goes out back to back; the REST fallback for the
+        ones it could not send is pipelined like the other *_many helpers.
+        """
+        rest: list[tuple[str, float, float]] = []
+        for label, x, y in items:
+            try:
+                if self.ws and self.ws.plugin_pos(label, x, y):
+                    continue
+            except OSError as e:
+                log.warning("WebSocket position failed, using REST fallback: %s", e)
+            rest.append((label, x, y))
+        if rest:
+            self._map_concurrent(self._effect_position_rest, rest)
+
+    def _effect_position_rest(self, label: str, x: float, y: float) -> bool:
+        try:
+            result = self._get_url(f"{self._effect_position_url}{label}/{x}/{y}")
+        except (OSError, requests.RequestException) as e:
+            log.warning("REST position for %s failed: %s", label, e)
+            return False
+        return result is True
 
     # =========================================================================
     # Pedalboard API
@@ -959,9 +984,9 @@ class Client:
     # Files
     # =========================================================================
     def download_file(self, filepath: str):
-        scheme, url, *_ = self.base_url.split(":")
+        scheme, host, _ = _split_hostport(self.base_url)
         resp = requests.get(
-            f"{scheme}:{url}:8081" + f"/download/file/{filepath}",
+            f"{scheme}://{host}:8081/download/file/{filepath}",
             headers=HEADERS,
         )
         return resp.content
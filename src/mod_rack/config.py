@@ -24,22 +24,29 @@ class PluginConfig:
     uri: str
     category: str = ""
     # Опціональні override для портів (для моно/стерео конверсії)
-    disable_ports: list[str] = field(default_factory=list)
+    disable_ports: frozenset[str] = frozenset()
     # Явний режим каналів: "mono", "stereo", або None (авто)
     mode: str | None = None
     # All-to-all routing: з'єднати всі входи/виходи між собою
     join_audio_inputs: bool = False
     join_audio_outputs: bool = False
 
+    def __post_init__(self):
+        # TOML дає list; frozenset для O(1) перевірки портів
+        self.disable_ports = frozenset(self.disable_ports)
+
 
 @dataclass
 class HardwareConfig:
     # None = auto-detect from MOD-UI, list = override with specific ports
-    disable_ports: list[str] = field(default_factory=list)
+    disable_ports: frozenset[str] = frozenset()
     # All-to-all routing for hardware ports
     join_audio_inputs: bool = False  # Join all hardware inputs to first plugin
     join_audio_outputs: bool = False  # Join last plugin outputs to all hardware outputs
 
+    def __post_init__(self):
+        self.disable_ports = frozenset(self.disable_ports)
+
 
 @dataclass
 class ServerConfig:
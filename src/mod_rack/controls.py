@@ -10,13 +10,15 @@ Provides typed dataclasses for plugin control ports with support for:
 """
 
 import math
-from dataclasses import dataclass, field
-from enum import Flag, auto
-from typing import Any
+import sys
+from dataclasses import dataclass, field, replace
+from enum import Flag, IntEnum, auto
+from typing import Any, Mapping
 
 
 __all__ = [
     "ControlProperties",
+    "ControlKind",
     "ScalePoint",
     "Units",
     "ControlPort",
@@ -55,6 +57,26 @@ class ControlProperties(Flag):
         return result
 
 
+class ControlKind(IntEnum):
+    """Widget-level control type, resolved once from properties."""
+
+    KNOB = 0
+    TOGGLE = 1
+    ENUM = 2
+    INTEGER = 3
+
+    @classmethod
+    def from_properties(cls, properties: ControlProperties) -> "ControlKind":
+        # same precedence the UI factory used to apply per widget
+        if ControlProperties.TOGGLED in properties:
+            return cls.TOGGLE
+        if ControlProperties.ENUMERATION in properties:
+            return cls.ENUM
+        if ControlProperties.INTEGER in properties:
+            return cls.INTEGER
+        return cls.KNOB
+
+
 @dataclass(frozen=True, slots=True)
 class ScalePoint:
     """A discrete value option for enumeration controls."""
@@ -119,9 +141,15 @@ class ControlPort:
     units: Units | None = None
     range_steps: int = 0  # 0 = continuous
 
+    # Derived from properties in __post_init__
+    kind: ControlKind = field(init=False, repr=False)
+
     # Runtime state (mutable)
     _value: float | None = field(default=None, repr=False)
 
+    def __post_init__(self) -> None:
+        self.kind = ControlKind.from_properties(self.properties)
+
     @property
     def value(self) -> float:
         """Current value (default if not set)."""
@@ -132,6 +160,10 @@ class ControlPort:
         """Set value with bounds checking."""
         self._value = self.clamp(val)
 
+    def copy(self) -> "ControlPort":
+        """New instance sharing this port's immutable schema, value reset."""
+        return replace(self, _value=None)
+
     # --- Type checks ---
 
     @property
@@ -254,7 +286,7 @@ class ControlPort:
         scale_points_data = data.get("scalePoints", [])
 
         return cls(
-            symbol=data.get("symbol", ""),
+            symbol=sys.intern(data.get("symbol", "")),  # hot dict key
             name=data.get("name", ""),
             short_name=data.get("shortName", data.get("name", "")),
             index=data.get("index", 0),
@@ -272,7 +304,7 @@ class ControlPort:
         )
 
 
-def parse_control_ports(effect_data: dict[str, Any]) -> list[ControlPort]:
+def parse_control_ports(effect_data: Mapping[str, Any]) -> list[ControlPort]:
     """
     Parse all control input ports from effect_get response.
 
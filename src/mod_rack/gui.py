@@ -4,9 +4,14 @@ PySide6 UI for MODEP Rack control.
 Run with: python qrack.py
 """
 
+import logging
 import signal
+import socket
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import Callable, TypeAlias
 
 from mod_rack.client import GraphParamSetBypassEvent, GraphParamSetEvent
 from mod_rack.plugin import Plugin
@@ -34,31 +39,72 @@ from PySide6.QtWidgets import (
     QListWidgetItem,
     QDialogButtonBox,
     QMenu,
+    QSizePolicy,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import (
+    Qt,
+    QMimeData,
+    QObject,
+    QPoint,
+    QSocketNotifier,
+    QThread,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QDrag, QPixmap
 
-from mod_rack import Config, Rack, ControlPort
+from mod_rack import Config, Rack, ControlKind, ControlPort
 from mod_rack.rack import OrchestratorMode
 
+log = logging.getLogger(__name__)
+
+
+# Called with (symbol, value) on user change; a plain callable, not a Signal,
+# so building a page costs no per-control connections
+OnControlChange: TypeAlias = Callable[[str, float], None]
+
 
 class ControlWidget(QWidget):
     """Base widget for a plugin control."""
 
-    value_changed = Signal(str, float)  # symbol, value
-
     # Ignore incoming WS updates for this duration after a local change
     LOCAL_CHANGE_COOLDOWN_MS = 100
-
-    def __init__(self, control: ControlPort, parent=None):
+    # Dial drags: emit at most once per this window, latest value only
+    EMIT_INTERVAL_MS = 30
+
+    def __init__(
+        self,
+        control: ControlPort,
+        parent=None,
+        on_change: OnControlChange | None = None,
+    ):
         super().__init__(parent)
         self.control = control
+        self._on_change = on_change
         self._local_change_timer = QTimer(self)
         self._local_change_timer.setSingleShot(True)
 
+        self._pending_value: float | None = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._flush_emit)
+        # True while the user holds a dial: WS echoes would make it jitter
+        self._user_interacting = False
+
+    def bind(self, control: ControlPort):
+        """Show another instance's control of the same schema (widget reuse)."""
+        self._flush_emit()
+        self._local_change_timer.stop()
+        self._user_interacting = False
+        self.control = control
+        self._set_widget_value(control.value)
+
     def set_value_silent(self, value: float):
         """Set value from server without emitting signal.
-        Ignored while user is actively interacting (cooldown)."""
-        if self._local_change_timer.isActive():
+        Ignored while user is actively interacting (held dial or cooldown)."""
+        if self._user_interacting or self._local_change_timer.isActive():
             return
         self._set_widget_value(value)
 
@@ -67,9 +113,37 @@ class ControlWidget(QWidget):
         pass
 
     def _emit_change(self, value: float):
-        """Emit value change and start cooldown to ignore WS echo."""
+        """Emit value change and start cooldown to ignore WS echo.
+
+        The model (control.value) is not touched here: Plugin.param_set
+        stores it and the WS echo confirms it.
+        """
         self._local_change_timer.start(self.LOCAL_CHANGE_COOLDOWN_MS)
-        self.value_changed.emit(self.control.symbol, value)
+        if self._on_change is not None:
+            self._on_change(self.control.symbol, value)
+
+    def _emit_change_coalesced(self, value: float):
+        """Like _emit_change, but collapses bursts into one emit per interval."""
+        self._local_change_timer.start(self.LOCAL_CHANGE_COOLDOWN_MS)
+        self._pending_value = value
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    @Slot()
+    def _on_slider_pressed(self):
+        self._user_interacting = True
+
+    @Slot()
+    def _on_slider_released(self):
+        self._user_interacting = False
+        # final value goes out now; cooldown still covers its echo
+        self._flush_emit()
+
+    @Slot()
+    def _flush_emit(self):
+        if self._pending_value is not None:
+            value, self._pending_value = self._pending_value, None
+            self._emit_change(value)
 
 
 class KnobControl(ControlWidget):
@@ -77,8 +151,13 @@ class KnobControl(ControlWidget):
 
     SLIDER_STEPS = 1000
 
-    def __init__(self, control: ControlPort, parent=None):
-        super().__init__(control, parent)
+    def __init__(
+        self,
+        control: ControlPort,
+        parent=None,
+        on_change: OnControlChange | None = None,
+    ):
+        super().__init__(control, parent, on_change)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -96,6 +175,8 @@ class KnobControl(ControlWidget):
         self.dial.setRange(0, self.SLIDER_STEPS)
         self.dial.setValue(self._value_to_slider(control.value))
         self.dial.valueChanged.connect(self._on_slider_changed)
+        self.dial.sliderPressed.connect(self._on_slider_pressed)
+        self.dial.sliderReleased.connect(self._on_slider_released)
         layout.addWidget(self.dial)
 
         # Value display
@@ -103,6 +184,11 @@ class KnobControl(ControlWidget):
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.value_label)
 
+        # Dial position -> formatted text; the schema is fixed per URI, so
+        # the cache stays valid when the widget is rebound to another instance
+        self._fmt_cache: dict[int, str] = {}
+        self._last_pos: int | None = None
+
     def _value_to_slider(self, value: float) -> int:
         """Convert actual value to slider position using normalize."""
         normalized = self.control.normalize(value)
@@ -113,12 +199,21 @@ class KnobControl(ControlWidget):
         normalized = pos / self.SLIDER_STEPS
         return self.control.denormalize(normalized)
 
+    @Slot(int)
     def _on_slider_changed(self, pos: int):
+        if pos == self._last_pos:
+            return
+        self._last_pos = pos
         value = self._slider_to_value(pos)
-        self.value_label.setText(self.control.format_value(value))
-        self._emit_change(value)
+        text = self._fmt_cache.get(pos)
+        if text is None:
+            # bounded: at most SLIDER_STEPS + 1 entries
+            text = self._fmt_cache[pos] = self.control.format_value(value)
+        self.value_label.setText(text)
+        self._emit_change_coalesced(value)
 
     def _set_widget_value(self, value: float):
+        self._last_pos = None
         self.dial.blockSignals(True)
         self.dial.setValue(self._value_to_slider(value))
         self.dial.blockSignals(False)
@@ -128,8 +223,13 @@ class KnobControl(ControlWidget):
 class ToggleControl(ControlWidget):
     """Checkbox for toggle controls."""
 
-    def __init__(self, control: ControlPort, parent=None):
-        super().__init__(control, parent)
+    def __init__(
+        self,
+        control: ControlPort,
+        parent=None,
+        on_change: OnControlChange | None = None,
+    ):
+        super().__init__(control, parent, on_change)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -139,9 +239,9 @@ class ToggleControl(ControlWidget):
         self.checkbox.stateChanged.connect(self._on_state_changed)
         layout.addWidget(self.checkbox)
 
+    @Slot(int)
     def _on_state_changed(self, state):
         value = 1.0 if state == Qt.Checked else 0.0
-        self.control.value = value
         self._emit_change(value)
 
     def _set_widget_value(self, value: float):
@@ -153,8 +253,13 @@ class ToggleControl(ControlWidget):
 class EnumControl(ControlWidget):
     """ComboBox for enumeration controls."""
 
-    def __init__(self, control: ControlPort, parent=None):
-        super().__init__(control, parent)
+    def __init__(
+        self,
+        control: ControlPort,
+        parent=None,
+        on_change: OnControlChange | None = None,
+    ):
+        super().__init__(control, parent, on_change)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -167,6 +272,10 @@ class EnumControl(ControlWidget):
         self.combo = QComboBox()
         for sp in control.scale_points:
             self.combo.addItem(sp.label, sp.value)
+        # value -> combo index; first occurrence wins like the old linear scan
+        self._value_to_idx: dict[float, int] = {}
+        for i, sp in enumerate(control.scale_points):
+            self._value_to_idx.setdefault(sp.value, i)
 
         # Set current value
         current_idx = self._value_to_index(control.value)
@@ -177,15 +286,12 @@ class EnumControl(ControlWidget):
         layout.addWidget(self.combo)
 
     def _value_to_index(self, value: float) -> int:
-        for i, sp in enumerate(self.control.scale_points):
-            if sp.value == value:
-                return i
-        return 0
+        return self._value_to_idx.get(value, 0)
 
+    @Slot(int)
     def _on_index_changed(self, index: int):
         if index >= 0:
             value = self.combo.itemData(index)
-            self.control.value = value
             self._emit_change(value)
 
     def _set_widget_value(self, value: float):
@@ -199,8 +305,15 @@ class EnumControl(ControlWidget):
 class IntegerControl(ControlWidget):
     """Slider for integer controls (non-enum)."""
 
-    def __init__(self, control: ControlPort, parent=None):
-        super().__init__(control, parent)
+    FMT_CACHE_SIZE = 1024  # integer ranges can be wide
+
+    def __init__(
+        self,
+        control: ControlPort,
+        parent=None,
+        on_change: OnControlChange | None = None,
+    ):
+        super().__init__(control, parent, on_change)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -216,6 +329,8 @@ class IntegerControl(ControlWidget):
         self.slider.setRange(int(control.minimum), int(control.maximum))
         self.slider.setValue(int(control.value))
         self.slider.valueChanged.connect(self._on_slider_changed)
+        self.slider.sliderPressed.connect(self._on_slider_pressed)
+        self.slider.sliderReleased.connect(self._on_slider_released)
         layout.addWidget(self.slider)
 
         # Value display
@@ -223,9 +338,17 @@ class IntegerControl(ControlWidget):
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.value_label)
 
+        self._fmt_cache: dict[int, str] = {}
+
+    @Slot(int)
     def _on_slider_changed(self, value: int):
-        self.value_label.setText(self.control.format_value(value))
-        self._emit_change(float(value))
+        text = self._fmt_cache.get(value)
+        if text is None:
+            text = self.control.format_value(value)
+            if len(self._fmt_cache) < self.FMT_CACHE_SIZE:
+                self._fmt_cache[value] = text
+        self.value_label.setText(text)
+        self._emit_change_coalesced(float(value))
 
     def _set_widget_value(self, value: float):
         self.slider.blockSignals(True)
@@ -234,15 +357,20 @@ class IntegerControl(ControlWidget):
         self.value_label.setText(self.control.format_value(value))
 
 
-def create_control_widget(control: ControlPort, parent=None) -> ControlWidget:
+def create_control_widget(
+    control: ControlPort, parent=None, on_change: OnControlChange | None = None
+) -> ControlWidget:
     """Factory function to create appropriate widget for control type."""
-    if control.is_toggled:
-        return ToggleControl(control, parent)
-    if control.is_enumeration:
-        return EnumControl(control, parent)
-    if control.is_integer and not control.is_enumeration:
-        return IntegerControl(control, parent)
-    return KnobControl(control, parent)
+    return _WIDGET_CLASSES[control.kind](control, parent, on_change)
+
+
+# ControlPort.kind -> widget class
+_WIDGET_CLASSES: dict[ControlKind, type[ControlWidget]] = {
+    ControlKind.TOGGLE: ToggleControl,
+    ControlKind.ENUM: EnumControl,
+    ControlKind.INTEGER: IntegerControl,
+    ControlKind.KNOB: KnobControl,
+}
 
 
 class PluginSelectorDialog(QDialog):
@@ -260,14 +388,15 @@ class PluginSelectorDialog(QDialog):
         # Plugin list - show only whitelisted plugins
         self.list_widget = QListWidget()
 
-        for p_config in rack.config.plugins:
-            name = p_config.name
-            uri = p_config.uri
-            category = p_config.category or "General"
-
-            item = QListWidgetItem(f"{name}\n  [{category}]")
-            item.setData(Qt.ItemDataRole.UserRole, uri)
-            self.list_widget.addItem(item)
+        # Populate in one batch: a single insert and layout pass
+        plugins = rack.config.plugins
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.addItems(
+            [f"{p.name}\n  [{p.category or 'General'}]" for p in plugins]
+        )
+        for i, p_config in enumerate(plugins):
+            self.list_widget.item(i).setData(Qt.ItemDataRole.UserRole, p_config.uri)
+        self.list_widget.setUpdatesEnabled(True)
 
         self.list_widget.itemDoubleClicked.connect(self._on_double_click)
         layout.addWidget(self.list_widget)
@@ -280,10 +409,12 @@ class PluginSelectorDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    @Slot(QListWidgetItem)
     def _on_double_click(self, item):
         self.selected_uri = item.data(Qt.UserRole)
         self.accept()
 
+    @Slot()
     def _on_accept(self):
         current = self.list_widget.currentItem()
         if current:
@@ -299,6 +430,8 @@ class SlotWidget(QFrame):
     replace_requested = Signal(str)  # label
     dropped = Signal(str, int)  # source_label, destination_index
 
+    MOVE_TRACE_INTERVAL = 0.033  # seconds
+
     def __init__(self, label: str, index: int, plugin_name: str, parent=None):
         super().__init__(parent)
         self.slot_label_id = label  # Plugin label (unique ID)
@@ -313,6 +446,9 @@ class SlotWidget(QFrame):
         self.customContextMenuRequested.connect(self._show_context_menu)
         self.setAcceptDrops(True)
         self._drag_start_pos = None
+        self._drag_threshold = QApplication.startDragDistance()
+        self._last_move_ts = 0.0
+        self._drag_pixmap: QPixmap | None = None  # static while content unchanged
 
         layout = QVBoxLayout(self)
 
@@ -330,15 +466,33 @@ class SlotWidget(QFrame):
         self._update_style()
 
     def set_selected(self, selected: bool):
-        self.is_selected = selected
-        self._update_style()
+        if selected != self.is_selected:
+            self.is_selected = selected
+            self._update_style()
 
-    def _update_style(self):
-        if self.is_selected:
-            self.setStyleSheet("SlotWidget { background-color: #3daee9; }")
-        else:
-            self.setStyleSheet("")
+    def set_index(self, index: int):
+        if index != self.index:
+            self.index = index
+            self.slot_num_label.setText(f"Slot {index}")
+            self._invalidate_drag_pixmap()
+
+    def set_plugin_name(self, name: str):
+        if name != self.plugin_label.text():
+            self.plugin_label.setText(name)
+            self._invalidate_drag_pixmap()
+
+    def _invalidate_drag_pixmap(self):
+        self._drag_pixmap = None
 
+    def _update_style(self):
+        # Rule lives in MainWindow's stylesheet; only re-polish against it
+        self._invalidate_drag_pixmap()
+        self.setProperty("selected", self.is_selected)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
+    @Slot(QPoint)
     def _show_context_menu(self, pos):
         """Show context menu for slot operations."""
         menu = QMenu()
@@ -357,65 +511,71 @@ class SlotWidget(QFrame):
 
     def mousePressEvent(self, event):
         # emit click and store drag start position
-        print(f"MOUSE_PRESS: label={self.slot_label_id} pos={event.pos()}")
+        log.debug("MOUSE_PRESS: label=%s pos=%s", self.slot_label_id, event.pos())
         self.clicked.emit(self.slot_label_id)
         self._drag_start_pos = event.pos()
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.LeftButton and self._drag_start_pos is not None:
-            distance = (event.pos() - self._drag_start_pos).manhattanLength()
-            print(f"MOUSE_MOVE: label={self.slot_label_id} distance={distance}")
-            if distance >= QApplication.startDragDistance():
-                from PySide6.QtGui import QDrag, QPixmap
-                from PySide6.QtCore import QMimeData
-
-                drag = QDrag(self)
-                mime = QMimeData()
-                # put both custom data and plain text for robustness
-                mime.setData(
-                    "application/x-slot-label", self.slot_label_id.encode("utf-8")
-                )
-                mime.setText(self.slot_label_id)
-                drag.setMimeData(mime)
-
-                # optional pixmap
-                pix = QPixmap(self.size())
-                self.render(pix)
-                drag.setPixmap(pix)
+        if self._drag_start_pos is None or not event.buttons() & Qt.LeftButton:
+            super().mouseMoveEvent(event)
+            return
 
-                print(f"START_DRAG: label={self.slot_label_id}")
-                # change cursor to closed hand while dragging
-                QApplication.setOverrideCursor(Qt.ClosedHandCursor)
-                result = drag.exec(Qt.MoveAction)
-                QApplication.restoreOverrideCursor()
-                print(f"DRAG_RESULT: label={self.slot_label_id} result={result}")
+        distance = (event.pos() - self._drag_start_pos).manhattanLength()
+        if distance >= self._drag_threshold:
+            self._start_drag()
+        elif log.isEnabledFor(logging.DEBUG):
+            # some compositors flood move events: trace at most every 33 ms
+            now = time.monotonic()
+            if now - self._last_move_ts >= self.MOVE_TRACE_INTERVAL:
+                self._last_move_ts = now
+                log.debug(
+                    "MOUSE_MOVE: label=%s distance=%s", self.slot_label_id, distance
+                )
 
         super().mouseMoveEvent(event)
 
+    def _start_drag(self):
+        drag = QDrag(self)
+        mime = QMimeData()
+        # labels are short ASCII: plain text is the only payload
+        mime.setText(self.slot_label_id)
+        drag.setMimeData(mime)
+
+        # optional pixmap, re-rendered only on content/size change
+        pix = self._drag_pixmap
+        if pix is None or pix.size() != self.size():
+            pix = self._drag_pixmap = QPixmap(self.size())
+            self.render(pix)
+        drag.setPixmap(pix)
+
+        log.debug("START_DRAG: label=%s", self.slot_label_id)
+        # change cursor to closed hand while dragging
+        QApplication.setOverrideCursor(Qt.ClosedHandCursor)
+        result = drag.exec(Qt.MoveAction)
+        QApplication.restoreOverrideCursor()
+        log.debug("DRAG_RESULT: label=%s result=%s", self.slot_label_id, result)
+
     def dragEnterEvent(self, event):
         mime = event.mimeData()
-        if mime.hasFormat("application/x-slot-label") or mime.hasText():
+        if mime.hasText():
             event.acceptProposedAction()
         else:
             event.ignore()
 
     def dragMoveEvent(self, event):
         mime = event.mimeData()
-        if mime.hasFormat("application/x-slot-label") or mime.hasText():
+        if mime.hasText():
             event.acceptProposedAction()
         else:
             event.ignore()
 
     def dropEvent(self, event):
         mime = event.mimeData()
-        if mime.hasFormat("application/x-slot-label") or mime.hasText():
-            if mime.hasText():
-                src_label = mime.text()
-            else:
-                src_label = bytes(mime.data("application/x-slot-label")).decode("utf-8")
+        if mime.hasText():
+            src_label = mime.text()
             # debug log
-            print(f"DROP_EVENT: src_label={src_label} dest_index={self.index}")
+            log.info("DROP_EVENT: src_label=%s dest_index=%s", src_label, self.index)
             # emit source label and this widget's index as destination
             self.dropped.emit(src_label, self.index)
             event.acceptProposedAction()
@@ -432,6 +592,7 @@ class ControlsPanel(QScrollArea):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         self.container = QWidget()
+        self.container.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
         self._layout = QVBoxLayout(self.container)
         self._layout.setAlignment(Qt.AlignTop)
         self.setWidget(self.container)
@@ -441,6 +602,13 @@ class ControlsPanel(QScrollArea):
         self.control_widgets: dict[str, ControlWidget] = {}
         self.bypass_checkbox: QCheckBox | None = None
 
+        # Built pages per plugin URI; reused (rebound) for every instance of
+        # a URI still in the rack, dropped by retain_uris() once it is gone
+        self._page: QWidget | None = None
+        self._panel_cache: dict[
+            str, tuple[QWidget, dict[str, ControlWidget], QCheckBox]
+        ] = {}
+
         # Placeholder
         self.placeholder = QLabel("Select a plugin to see controls")
         self.placeholder.setAlignment(Qt.AlignCenter)
@@ -448,51 +616,111 @@ class ControlsPanel(QScrollArea):
 
     def set_plugin(self, plugin, label: str | None = None):
         """Set the plugin to display controls for."""
-        # Clear existing
-        self._clear_controls()
+        # Send pending knob values to the plugin they belong to
+        for widget in self.control_widgets.values():
+            widget._flush_emit()
+
+        # Page swap and rebinding repaint once at the end
+        self.container.setUpdatesEnabled(False)
+        try:
+            self._show_plugin(plugin, label)
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    def _show_plugin(self, plugin, label: str | None):
+        if self._page is not None:
+            self._page.hide()
+            self._page = None
+
         self.plugin = plugin
         self.current_label = label
 
         if plugin is None:
+            self.control_widgets = {}
+            self.bypass_checkbox = None
             self.placeholder.setText("Select a plugin to see controls")
             self.placeholder.show()
             return
 
         self.placeholder.hide()
 
+        cached = self._panel_cache.get(plugin.uri)
+        if cached is not None and cached[1].keys() != plugin.keys():
+            # Instance has other controls than the page was built for
+            # (e.g. its metadata failed to load): build a fresh page
+            self._drop_page(plugin.uri)
+            cached = None
+        if cached is None:
+            cached = self._panel_cache[plugin.uri] = self._build_page(plugin)
+        else:
+            # Same URI, other instance: point widgets at its controls
+            for symbol, widget in cached[1].items():
+                widget.bind(plugin[symbol])
+        page, self.control_widgets, self.bypass_checkbox = cached
+
+        self.bypass_checkbox.blockSignals(True)
+        self.bypass_checkbox.setChecked(plugin.bypassed)
+        self.bypass_checkbox.blockSignals(False)
+
+        self._page = page
+        page.show()
+
+    def retain_uris(self, uris: set[str]):
+        """Drop cached pages of URIs no longer in the rack."""
+        current = self.plugin.uri if self.plugin is not None else None
+        for uri in [uri for uri in self._panel_cache if uri not in uris]:
+            if uri != current:
+                self._drop_page(uri)
+
+    def _drop_page(self, uri: str):
+        page = self._panel_cache.pop(uri)[0]
+        if page is self._page:
+            self._page = None
+        self._layout.removeWidget(page)
+        page.deleteLater()
+
+    def _build_page(
+        self, plugin
+    ) -> tuple[QWidget, dict[str, ControlWidget], QCheckBox]:
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        # No intermediate layout passes while children are added
+        page_layout.setEnabled(False)
+
         # Plugin name and bypass
         header = QHBoxLayout()
         name_label = QLabel(f"<b>{plugin.name}</b>")
         header.addWidget(name_label)
 
-        self.bypass_checkbox = QCheckBox("Bypass")
-        # Set initial state from plugin
-        bypassed = getattr(plugin, "_bypassed", False)
-        self.bypass_checkbox.setChecked(bypassed)
-        self.bypass_checkbox.toggled.connect(self._on_bypass_changed)
-        header.addWidget(self.bypass_checkbox)
+        bypass_checkbox = QCheckBox("Bypass")
+        bypass_checkbox.toggled.connect(self._on_bypass_changed)
+        header.addWidget(bypass_checkbox)
 
         header.addStretch()
 
-        self._layout.addLayout(header)
+        page_layout.addLayout(header)
 
         # Separator
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        self._layout.addWidget(line)
+        page_layout.addWidget(line)
 
         # Controls grid
         controls_group = QGroupBox("Controls")
         grid = QGridLayout(controls_group)
+        grid.setEnabled(False)
 
         row, col = 0, 0
         max_cols = 3
 
+        widgets: dict[str, ControlWidget] = {}
         for symbol in plugin:
             control = plugin[symbol]
-            widget = create_control_widget(control)
-            widget.value_changed.connect(self._on_control_changed)
-            self.control_widgets[symbol] = widget
+            widget = create_control_widget(control, on_change=self._on_control_changed)
+            widgets[symbol] = widget
+            # fixed-size cells: one control's relayout stays local
+            widget.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
             grid.addWidget(widget, row, col)
             col += 1
@@ -500,74 +728,145 @@ class ControlsPanel(QScrollArea):
                 col = 0
                 row += 1
 
-        self._layout.addWidget(controls_group)
-        self._layout.addStretch()
-
-    def _clear_controls(self):
-        """Remove all control widgets."""
-        for widget in self.control_widgets.values():
-            widget.deleteLater()
-        self.control_widgets.clear()
-        self.bypass_checkbox = None
-
-        # Clear layout
-        while self._layout.count():
-            item = self._layout.takeAt(0)
-            if item.widget() and item.widget() != self.placeholder:
-                item.widget().deleteLater()
-            elif item.layout():
-                self._clear_layout(item.layout())
-
-        self._layout.addWidget(self.placeholder)
-
-    def _clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                self._clear_layout(item.layout())
+        page_layout.addWidget(controls_group)
+        grid.setEnabled(True)
+        page_layout.setEnabled(True)
+        self._layout.addWidget(page)
+        return page, widgets, bypass_checkbox
 
     def _on_control_changed(self, symbol: str, value: float):
         """Handle control value change."""
         if self.plugin:
-            self.plugin.param_set(symbol, value)
+            # ControlWidget already coalesced the drag: send now
+            self.plugin.param_set(symbol, value, immediate=True)
 
     def set_bypass_silent(self, bypassed: bool):
         """Set bypass checkbox without emitting signal."""
         if self.bypass_checkbox:
-            self.blockSignals(True)
+            self.bypass_checkbox.blockSignals(True)
             self.bypass_checkbox.setChecked(bypassed)
-            self.blockSignals(False)
+            self.bypass_checkbox.blockSignals(False)
 
+    @Slot(bool)
     def _on_bypass_changed(self, state):
         """Handle bypass checkbox change."""
         if self.plugin:
             self.plugin.bypass(state)
 
 
+class RackWorker(QObject):
+    """Runs blocking rack REST requests off the UI thread.
+
+    Results arrive back through WS feedback, so nothing is returned here;
+    request_done only tells the UI that local rack state may have changed.
+    """
+
+    request_done = Signal()
+
+    def __init__(self, rack: Rack):
+        super().__init__()
+        self.rack = rack
+
+    @Slot(str, int)
+    def add_plugin_at(self, uri: str, index: int):
+        label = self.rack.request_add_plugin_at(uri, index)
+        if label:
+            log.info("Requested add plugin, label=%s", label)
+        else:
+            log.warning("Failed to request add plugin")
+
+    @Slot(str)
+    def remove_plugin(self, label: str):
+        if self.rack.request_remove_plugin(label):
+            log.info("Requested remove plugin %s", label)
+        else:
+            log.warning("Failed to request remove plugin %s", label)
+
+    @Slot(str, str)
+    def replace_plugin(self, label: str, uri: str):
+        # Preserve slot index: remove old, then request add at same index
+        insert_idx = self.rack.index_of(label)
+        # Request remove first
+        self.rack.request_remove_plugin(label)
+        # Request add at the same index (will be moved when WS feedback arrives)
+        if insert_idx is not None:
+            self.rack.request_add_plugin_at(uri, insert_idx)
+        else:
+            self.rack.request_add_plugin(uri)
+
+    @Slot(int, int)
+    def move_slot(self, from_idx: int, to_idx: int):
+        # Use rack.move_slot which handles reconnect
+        self.rack.request_move_slot(from_idx, to_idx)
+        self.request_done.emit()
+
+    @Slot()
+    def clear(self):
+        self.rack.clear()
+        self.request_done.emit()
+
+
+# Parsed once for the whole window; SlotWidget toggles the "selected" property
+WINDOW_STYLESHEET = 'SlotWidget[selected="true"] { background-color: #3daee9; }'
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
     order_changed_signal = Signal(list)
-    _param_changed_signal = Signal(str, str, float)  # label, symbol, value
+    _params_pending_signal = Signal()  # coalesced param updates are waiting
     _bypass_changed_signal = Signal(str, bool)  # label, bypassed
 
+    # UI thread → RackWorker thread
+    _add_requested = Signal(str, int)  # uri, index
+    _remove_requested = Signal(str)  # label
+    _replace_requested = Signal(str, str)  # label, uri
+    _move_requested = Signal(int, int)  # from_idx, to_idx
+    _clear_requested = Signal()
+
     def __init__(self, rack: Rack):
         super().__init__()
         self.rack = rack
         self.selected_label: str | None = None
 
+        # WS param updates coalesced per (label, symbol) until the main thread
+        # drains them: a knob sweep costs one UI update per control per flush
+        self._pending_params: dict[tuple[str, str], float] = {}
+        self._pending_lock = threading.Lock()
+
+        # Slot list sync coalesced to one per frame during bursts (preset load)
+        self._slot_sync_timer = QTimer(self)
+        self._slot_sync_timer.setSingleShot(True)
+        self._slot_sync_timer.setInterval(16)
+        self._slot_sync_timer.timeout.connect(self._sync_slot_widgets)
+
         # Connect rack callbacks to emit signals (WS thread → main thread)
-        self.order_changed_signal.connect(self._rebuild_slot_widgets)
-        self._param_changed_signal.connect(self._on_ws_param_changed)
-        self._bypass_changed_signal.connect(self._on_ws_bypass_changed)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.order_changed_signal.connect(self._schedule_slot_sync, queued)
+        self._params_pending_signal.connect(self._flush_param_events, queued)
+        self._bypass_changed_signal.connect(self._on_ws_bypass_changed, queued)
         self.rack.on_rack_order_changed(self._handle_rack_cb)
         self.rack.client.ws.on(GraphParamSetEvent, self._forward_param_event)
         self.rack.client.ws.on(GraphParamSetBypassEvent, self._forward_bypass_event)
 
+        # REST requests block on the network: run them in a worker thread
+        self._worker_thread = QThread(self)
+        self._worker = RackWorker(rack)
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._add_requested.connect(self._worker.add_plugin_at)
+        self._remove_requested.connect(self._worker.remove_plugin)
+        self._replace_requested.connect(self._worker.replace_plugin)
+        self._move_requested.connect(self._worker.move_slot)
+        self._clear_requested.connect(self._worker.clear)
+        self._worker.request_done.connect(
+            self._schedule_slot_sync, Qt.ConnectionType.QueuedConnection
+        )
+        self._worker_thread.start()
+
         self.setWindowTitle("MODEP Rack Controller")
         self.setMinimumSize(800, 600)
+        self.setStyleSheet(WINDOW_STYLESHEET)
 
         # Central widget
         central = QWidget()
@@ -585,6 +884,7 @@ class MainWindow(QMainWindow):
         self.left_panel.addLayout(self.slots_container)
 
         self.slot_widgets: list[SlotWidget] = []
+        self._slot_widgets_by_label: dict[str, SlotWidget] = {}
 
         # Add plugin button (no empty slots anymore)
         self.add_plugin_btn = QPushButton("+ Add Plugin")
@@ -612,38 +912,63 @@ class MainWindow(QMainWindow):
         # Просто перекидаємо дані в головний потік через сигнал
         self.order_changed_signal.emit(slots)
 
-    def _rebuild_slot_widgets(self):
-        """Rebuild all slot widgets from rack state."""
-        # Clear existing widgets
-        for widget in self.slot_widgets:
-            widget.deleteLater()
-        self.slot_widgets.clear()
-
-        # Clear layout
-        while self.slots_container.count():
-            item = self.slots_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Create new widgets for each slot
-        for i, slot in enumerate(self.rack.slots):
-            plugin_name = slot.plugin.name
-            slot_widget = SlotWidget(slot.label, i, plugin_name)
-            slot_widget.clicked.connect(self._on_slot_clicked)
-            slot_widget.remove_requested.connect(self._on_remove_plugin)
-            slot_widget.replace_requested.connect(self._on_replace_plugin)
-            slot_widget.dropped.connect(self._on_slot_dropped)
-            self.slot_widgets.append(slot_widget)
-            self.slots_container.addWidget(slot_widget)
-
-        # Update selection
-        if self.selected_label and self.rack.get_slot_by_label(self.selected_label):
-            self._select_slot(self.selected_label)
-        elif self.rack.slots:
-            self._select_slot(self.rack.slots[0].label)
-        else:
-            self.selected_label = None
-            self.controls_panel.set_plugin(None)
+    @Slot()
+    def _schedule_slot_sync(self):
+        if not self._slot_sync_timer.isActive():
+            self._slot_sync_timer.start()
+
+    @Slot()
+    def _sync_slot_widgets(self):
+        """Bring slot widgets in line with rack state, reusing existing ones."""
+        # One repaint for the whole batch of inserts/moves
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            by_label = self._slot_widgets_by_label
+            slots = list(self.rack.slots)
+            labels = {slot.label for slot in slots}
+
+            # Drop widgets of removed slots
+            for label in [label for label in by_label if label not in labels]:
+                widget = by_label.pop(label)
+                self.slots_container.removeWidget(widget)
+                widget.deleteLater()
+
+            # Create missing widgets, then move each into place
+            widgets: list[SlotWidget] = []
+            for i, slot in enumerate(slots):
+                widget = by_label.get(slot.label)
+                if widget is None:
+                    widget = by_label[slot.label] = self._create_slot_widget(slot, i)
+                else:
+                    widget.set_index(i)
+                    widget.set_plugin_name(slot.plugin.name)
+                item = self.slots_container.itemAt(i)
+                if item is None or item.widget() is not widget:
+                    self.slots_container.removeWidget(widget)
+                    self.slots_container.insertWidget(i, widget)
+                widgets.append(widget)
+            self.slot_widgets = widgets
+
+            # Update selection
+            if self.selected_label and self.selected_label in labels:
+                self._select_slot(self.selected_label)
+            elif slots:
+                self._select_slot(slots[0].label)
+            else:
+                self.selected_label = None
+                self.controls_panel.set_plugin(None)
+            self.controls_panel.retain_uris({slot.plugin.uri for slot in slots})
+        finally:
+            central.setUpdatesEnabled(True)
+
+    def _create_slot_widget(self, slot, index: int) -> SlotWidget:
+        slot_widget = SlotWidget(slot.label, index, slot.plugin.name)
+        slot_widget.clicked.connect(self._on_slot_clicked)
+        slot_widget.remove_requested.connect(self._on_remove_plugin)
+        slot_widget.replace_requested.connect(self._on_replace_plugin)
+        slot_widget.dropped.connect(self._on_slot_dropped)
+        return slot_widget
 
     def _select_slot(self, label: str):
         """Select a slot and show its controls."""
@@ -654,72 +979,56 @@ class MainWindow(QMainWindow):
 
         slot = self.rack.get_slot_by_label(label)
         if slot:
-            self.controls_panel.set_plugin(slot.plugin, label)
+            # Same plugin already shown: keep its control widgets
+            if self.controls_panel.plugin is not slot.plugin:
+                self.controls_panel.set_plugin(slot.plugin, label)
         else:
             self.controls_panel.set_plugin(None)
 
+    @Slot(str)
     def _on_slot_clicked(self, label: str):
         """Handle slot click - select it."""
         self._select_slot(label)
 
+    @Slot()
     def _on_add_plugin(self):
         """Add a new plugin (request via REST, wait for WS feedback)."""
         dialog = PluginSelectorDialog(self.rack, self)
         if dialog.exec() == QDialog.Accepted and dialog.selected_uri:
-            label = self.rack.request_add_plugin_at(
-                dialog.selected_uri, len(self.rack.slots)
-            )
-            if label:
-                print(f"Requested add plugin, label={label}")
-            else:
-                print("Failed to request add plugin")
+            self._add_requested.emit(dialog.selected_uri, len(self.rack.slots))
 
+    @Slot(str)
     def _on_remove_plugin(self, label: str):
         """Remove plugin (request via REST, wait for WS feedback)."""
-        success = self.rack.request_remove_plugin(label)
-        if success:
-            print(f"Requested remove plugin {label}")
-        else:
-            print(f"Failed to request remove plugin {label}")
+        self._remove_requested.emit(label)
 
+    @Slot(str)
     def _on_replace_plugin(self, label: str):
         """Replace plugin - remove old, add new."""
         dialog = PluginSelectorDialog(self.rack, self)
         if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_uri:
-            # Preserve slot index: remove old, then request add at same index
-            slot = self.rack.get_slot_by_label(label)
-            insert_idx = self.rack.slots.index(slot) if slot else None
-            # Request remove first
-            self.rack.request_remove_plugin(label)
-            # Request add at the same index (will be moved when WS feedback arrives)
-            if insert_idx is not None:
-                self.rack.request_add_plugin_at(dialog.selected_uri, insert_idx)
-            else:
-                self.rack.request_add_plugin(dialog.selected_uri)
-
-            return
+            self._replace_requested.emit(label, dialog.selected_uri)
 
+    @Slot()
     def _on_clear_all(self):
         """Clear all plugins."""
-        self.rack.clear()
-        # Immediately update UI to reflect cleared state
-        self._rebuild_slot_widgets()
+        # Runs on the worker thread; widgets follow via request_done/WS order
+        self._clear_requested.emit()
 
+    @Slot(str, int)
     def _on_slot_dropped(self, src_label: str, dest_index: int):
         """Handle drag-and-drop reorder: move src slot to dest index."""
-        print(f"ON_SLOT_DROPPED: src_label={src_label} dest_index={dest_index}")
-        src_slot = self.rack.get_slot_by_label(src_label)
-        if not src_slot:
+        log.info("ON_SLOT_DROPPED: src_label=%s dest_index=%s", src_label, dest_index)
+        from_idx = self.rack.index_of(src_label)
+        if from_idx is None:
             return
-        from_idx = self.rack.slots.index(src_slot)
         to_idx = dest_index
-        print(f"ON_SLOT_DROPPED: from_idx={from_idx} to_idx={to_idx}")
+        log.debug("ON_SLOT_DROPPED: from_idx=%s to_idx=%s", from_idx, to_idx)
         if from_idx == to_idx:
             return
-        # Use rack.move_slot which handles reconnect
-        self.rack.request_move_slot(from_idx, to_idx)
-        # Rebuild UI to reflect new order and keep selection on moved slot
-        self._rebuild_slot_widgets()
+        self._move_requested.emit(from_idx, to_idx)
+        # Keep selection on the moved slot; the new order is synced once the
+        # worker is done (request_done) and again on the WS order change
         self._select_slot(src_label)
 
     # =========================================================================
@@ -727,8 +1036,21 @@ class MainWindow(QMainWindow):
     # =========================================================================
 
     def _forward_param_event(self, event: GraphParamSetEvent):
-        """Forward WS event to main thread via signal."""
-        self._param_changed_signal.emit(event.label, event.symbol, event.value)
+        """Queue WS event for the main thread, keeping only the latest value."""
+        key = (event.label, event.symbol)
+        with self._pending_lock:
+            schedule = not self._pending_params
+            self._pending_params[key] = event.value
+        if schedule:
+            self._params_pending_signal.emit()
+
+    @Slot()
+    def _flush_param_events(self):
+        """Apply queued parameter changes in main thread."""
+        with self._pending_lock:
+            pending, self._pending_params = self._pending_params, {}
+        for (label, symbol), value in pending.items():
+            self._on_ws_param_changed(label, symbol, value)
 
     def _forward_bypass_event(self, event: GraphParamSetBypassEvent):
         """Forward WS event to main thread via signal."""
@@ -743,22 +1065,60 @@ class MainWindow(QMainWindow):
             widget = self.controls_panel.control_widgets[symbol]
             widget.set_value_silent(value)
 
+    @Slot(str, bool)
     def _on_ws_bypass_changed(self, label: str, bypassed: bool):
         """Handle bypass change in main thread."""
         if label == self.selected_label:
             self.controls_panel.set_bypass_silent(bypassed)
 
+    @Slot(list)
     def _on_rack_order_changed(self, order: list):
         """Handle order change from WebSocket - rebuild UI."""
-        print(f"UI: Order changed: {order}")
-        self._rebuild_slot_widgets()
+        log.debug("UI: Order changed: %s", order)
+        self._sync_slot_widgets()
 
     def closeEvent(self, event):
         """Called when user closes window."""
-        print("Closing rack connection...")
+        log.info("Closing rack connection...")
+        # Unhook WS-thread callbacks first so nothing is queued at a closing window
+        self.rack.off_rack_order_changed(self._handle_rack_cb)
+        self.rack.client.ws.off(GraphParamSetEvent, self._forward_param_event)
+        self.rack.client.ws.off(GraphParamSetBypassEvent, self._forward_bypass_event)
+        self.order_changed_signal.disconnect(self._schedule_slot_sync)
+        self._params_pending_signal.disconnect(self._flush_param_events)
+        self._bypass_changed_signal.disconnect(self._on_ws_bypass_changed)
+        self._worker.request_done.disconnect(self._schedule_slot_sync)
+        self._slot_sync_timer.stop()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        self.rack.shutdown()
         event.accept()
 
 
+def _install_signal_wakeup(app: QApplication) -> QObject:
+    """Let Python signal handlers run while Qt's C++ event loop is blocked.
+
+    POSIX: the signal writes a byte to a socketpair watched by a
+    QSocketNotifier, so the loop wakes only when a signal arrives.
+    Elsewhere: fall back to a slow idle timer.
+    """
+    if hasattr(socket, "AF_UNIX"):
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+        signal.set_wakeup_fd(wsock.fileno())
+        notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read, app)
+        # drain; the Python-level handler runs once we are back in the interpreter
+        notifier.activated.connect(lambda *_: rsock.recv(64))
+        notifier._sockets = (rsock, wsock)  # type: ignore[attr-defined]
+        return notifier
+
+    timer = QTimer(app)
+    timer.start(5000)
+    timer.timeout.connect(lambda: None)
+    return timer
+
+
 def main():
     # Load config
 
@@ -773,6 +1133,8 @@ def main():
     parser.add_argument("--slave", help="Slave", action="store_true")
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     config = Config.load(args.config)
 
     if args.server:
@@ -787,9 +1149,6 @@ def main():
     # Create and run app
     app = QApplication(sys.argv)
 
-    # Handle Ctrl+C
-    signal.signal(signal.SIGINT, signal.SIG_DFL)
-
     window = MainWindow(rack)
     title = window.windowTitle()
     if args.slave:
@@ -799,10 +1158,9 @@ def main():
 
     window.show()
 
-    # Timer for Ctrl+C on Linux/Windows
-    timer = QTimer()
-    timer.start(500)
-    timer.timeout.connect(lambda: None)
+    # Ctrl+C closes the window, so closeEvent cleanup still runs
+    signal.signal(signal.SIGINT, lambda *_: window.close())
+    wakeup = _install_signal_wakeup(app)  # noqa: F841 (keep alive)
 
     sys.exit(app.exec())
 
@@ -7,16 +7,138 @@ dict-like access to control parameters with automatic API synchronization.
 
 from __future__ import annotations
 
+import logging
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterator
-
-from mod_rack.client import GraphParamSetBypassEvent, Client, GraphParamSetEvent
+from typing import Any, ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+
+from mod_rack.client import (
+    EFFECT_CACHE_SIZE,
+    GraphParamSetBypassEvent,
+    Client,
+    GraphParamSetEvent,
+)
 from mod_rack.config import Config, PluginConfig
-from mod_rack.controls import ControlPort, parse_control_ports
+from mod_rack.controls import ControlPort
 
 
 __all__ = ["Port", "Plugin"]
 
+log = logging.getLogger(__name__)
+
+
+# (port kind, direction) -> Plugin attribute for each parsed port list
+_PORT_ATTRS = {
+    ("audio", "input"): "audio_inputs",
+    ("audio", "output"): "audio_outputs",
+    ("midi", "input"): "midi_inputs",
+    ("midi", "output"): "midi_outputs",
+}
+
+
+class _ControlNotFound(KeyError):
+    """KeyError that lists available controls only when rendered."""
+
+    def __init__(self, symbol: str, controls: Mapping[str, object]):
+        super().__init__(symbol)
+        self._controls = controls
+
+    def __str__(self) -> str:
+        return f"Control '{self.args[0]}' not found. Available: {list(self._controls)}"
+
+
+class _ControlsView(Mapping[str, ControlPort]):
+    """Read-only symbol -> ControlPort view over a plugin's control list."""
+
+    __slots__ = ("_index", "_list")
+
+    def __init__(self, index: Mapping[str, int], controls: list[ControlPort]):
+        self._index = index
+        self._list = controls
+
+    def __getitem__(self, symbol: str) -> ControlPort:
+        return self._list[self._index[symbol]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(f'{k!r}: {v!r}' for k, v in self.items())}}}"
+
+
+_Schema = tuple[tuple[ControlPort, ...], dict[str, int]]
+
+# client -> uri -> (parsed control ports, symbol -> position); prototypes are
+# never handed out, the index is shared by every instance of the URI. Scoped
+# per Client (host) like its effect cache and bounded the same way.
+_control_schemas: weakref.WeakKeyDictionary[Client, dict[str, _Schema]] = (
+    weakref.WeakKeyDictionary()
+)
+_control_schemas_lock = threading.Lock()
+
+
+def _get_schema(client: Client, uri: str) -> _Schema | None:
+    with _control_schemas_lock:
+        schemas = _control_schemas.get(client)
+        return schemas.get(uri) if schemas is not None else None
+
+
+def _store_schema(client: Client, uri: str, schema: _Schema) -> None:
+    with _control_schemas_lock:
+        schemas = _control_schemas.setdefault(client, {})
+        if uri not in schemas and len(schemas) >= EFFECT_CACHE_SIZE:
+            schemas.pop(next(iter(schemas)))
+        schemas[uri] = schema
+
+
+class _ParamCoalescer:
+    """Sends only the latest value per (plugin, symbol) per PARAM_SET_INTERVAL.
+
+    One lazily started daemon thread serves every plugin; plugins are held
+    only while a value is pending, never between windows.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[Plugin, str], float] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, plugin: Plugin, symbol: str, value: float) -> None:
+        with self._lock:
+            self._pending[(plugin, symbol)] = value
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="param-coalescer", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            # вікно збору: значення, що прийшли за цей час, перезаписують старі
+            time.sleep(Plugin.PARAM_SET_INTERVAL)
+            self._wake.clear()
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for (plugin, symbol), value in pending.items():
+                try:
+                    if not plugin._send_param(symbol, value):
+                        log.warning("param_set %s/%s failed", plugin.label, symbol)
+                except (OSError, ValueError) as err:
+                    log.warning("param_set %s/%s failed: %s", plugin.label, symbol, err)
+
 
 @dataclass(frozen=True, slots=True)
 class Port:
@@ -40,16 +162,50 @@ class Plugin:
         name: Display name
     """
 
+    # Outbound param_set coalescing window, seconds (0 = send immediately)
+    PARAM_SET_INTERVAL = 0.016
+
+    __slots__ = (
+        "client",
+        "uri",
+        "label",
+        "name",
+        "_bypassed",
+        "_config",
+        "_control_list",
+        "_control_index",
+        "_controls_view",
+        "audio_inputs",
+        "audio_outputs",
+        "midi_inputs",
+        "midi_outputs",
+        "join_audio_inputs",
+        "join_audio_outputs",
+        "_effect_data",
+        "_size",
+        "_repr_cache",
+        "__weakref__",  # WsClient holds handlers as WeakMethod
+    )
+
     def __init__(
-        self, client: Client, uri: str, label: str, config: PluginConfig | None
+        self,
+        client: Client,
+        uri: str,
+        label: str,
+        config: PluginConfig | None,
+        subscribe: bool = True,
     ):
         self.client = client
         self.uri = uri
         self.label = label
 
         self._bypassed = False
+        self._size: tuple[int, int] | None = None
         self._config = config
-        self._controls: dict[str, ControlPort] = {}
+        self._control_list: list[ControlPort] = []
+        self._control_index: Mapping[str, int] = {}
+        self._controls_view = _ControlsView(self._control_index, self._control_list)
+        self._repr_cache: str | None = None
 
         # io setup
         self.audio_inputs: list[Port] = []
@@ -65,36 +221,61 @@ class Plugin:
             config.join_audio_outputs if config is not None else False
         )
 
-        self._effect_data: dict = self.client.effect_get(self.uri)
+        effect_data = self.client.effect_get_cached(self.uri)
+        self._effect_data: Mapping[str, Any] = (
+            effect_data if effect_data is not None else {}
+        )
         self.name = self._effect_data.get("name", self.label)
 
-        self.size: tuple[int, int] = self.client.effect_image_size(
-            self.uri, "screenshot.png"
-        )
-        self._load_plugin_ports()
-        self._load_controls()
-        self._subscribe()
+        self._load_ports()
+        if subscribe:
+            self._subscribe()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Screenshot size, fetched on first access (only layout/UI needs it)."""
+        if self._size is None:
+            self._size = self.client.effect_image_size_cached(
+                self.uri, "screenshot.png"
+            )
+        return self._size
 
     def _subscribe(self):
-        self.client.ws.on(GraphParamSetBypassEvent, self._on_bypass_change)
-        self.client.ws.on(GraphParamSetEvent, self._on_param_change)
+        # Routed by label on the WS side, so handlers see only our events
+        ws = self.client.ws
+        ws.on_label(GraphParamSetBypassEvent, self.label, self._on_bypass_change)
+        ws.on_label(GraphParamSetEvent, self.label, self._on_param_change)
+
+    @staticmethod
+    def subscribe_all(client: Client, plugins: Iterable[Plugin]) -> None:
+        """Subscribe plugins created with subscribe=False, in one batch."""
+        plugins = list(plugins)
+        client.ws.on_labels(
+            GraphParamSetBypassEvent, {p.label: p._on_bypass_change for p in plugins}
+        )
+        client.ws.on_labels(
+            GraphParamSetEvent, {p.label: p._on_param_change for p in plugins}
+        )
 
     def _on_bypass_change(self, event: GraphParamSetBypassEvent):
-        if self.label == event.label:
-            self._bypassed = event.bypassed
+        self._bypassed = event.bypassed
 
     def _on_param_change(self, event: GraphParamSetEvent):
-        if self.label == event.label and event.symbol in self.controls:
-            self.set_cached_value(event.symbol, event.value)
+        self.set_cached_value(event.symbol, event.value)
 
     @classmethod
     def load_supported(
-        cls, client: Client, uri: str, label: str, config: Config
+        cls,
+        client: Client,
+        uri: str,
+        label: str,
+        config: Config,
+        subscribe: bool = True,
     ) -> Plugin | None:
         # Перевіряємо whitelist
         plugin_config = config.get_plugin_by_uri(uri)
         if not plugin_config:
-            print(f"  Plugin {uri} not in whitelist, ignoring")
+            log.warning("Plugin %s not in whitelist, ignoring", uri)
             return None
 
         plugin = cls(
@@ -102,110 +283,126 @@ class Plugin:
             uri=uri,
             label=label,
             config=plugin_config,
+            subscribe=subscribe,
         )
         return plugin
 
-    def _load_plugin_ports(self) -> None:
-        """Load and filter plugin ports from effect data.
-
-        Args:
-            label: Plugin label for graph paths
-            effect_data: Data from effect_get API
-
-        Returns:
-            Tuple of (inputs, outputs) Port lists
-        """
-        # Parse all ports from effect data
-
-        ports: dict = self._effect_data.get("ports", {})
-        audio_ports: dict = ports.get("audio", {})
-        midi_ports: dict = ports.get("midi", {})
-
-        config = self._config
-        label = self.label
-
-        for p in audio_ports.get("input", []):
-            if config is not None and p["symbol"] in config.disable_ports:
-                continue
-            self.audio_inputs.append(
-                Port(
-                    symbol=p["symbol"],
-                    name=p.get("name", p["symbol"]),
-                    graph_path=f"{label}/{p['symbol']}",
-                )
-            )
-        for p in audio_ports.get("output", []):
-            if config is not None and p["symbol"] in config.disable_ports:
-                continue
-            self.audio_outputs.append(
-                Port(
-                    symbol=p["symbol"],
-                    name=p.get("name", p["symbol"]),
-                    graph_path=f"{label}/{p['symbol']}",
-                )
-            )
-        for p in midi_ports.get("input", []):
-            if config is not None and p["symbol"] in config.disable_ports:
-                continue
-            self.midi_inputs.append(
-                Port(
-                    symbol=p["symbol"],
-                    name=p.get("name", p["symbol"]),
-                    graph_path=f"{label}/{p['symbol']}",
-                )
-            )
-        for p in midi_ports.get("output", []):
-            if config is not None and p["symbol"] in config.disable_ports:
-                continue
-            self.midi_outputs.append(
-                Port(
-                    symbol=p["symbol"],
-                    name=p.get("name", p["symbol"]),
-                    graph_path=f"{label}/{p['symbol']}",
+    @classmethod
+    def load_many(
+        cls,
+        client: Client,
+        items: Iterable[tuple[str, str]],
+        config: Config,
+        subscribe: bool = True,
+        max_workers: int = 8,
+    ) -> list[Plugin | None]:
+        """load_supported for many (uri, label) pairs, fetching metadata concurrently."""
+        items = list(items)
+        if len(items) <= 1:
+            return [
+                cls.load_supported(client, uri, label, config, subscribe)
+                for uri, label in items
+            ]
+        with ThreadPoolExecutor(min(max_workers, len(items))) as ex:
+            return list(
+                ex.map(
+                    lambda item: cls.load_supported(
+                        client, item[0], item[1], config, subscribe
+                    ),
+                    items,
                 )
             )
 
-        print(
-            f"Parsed audio ports: inputs={self.audio_inputs}, outputs={self.audio_outputs}"
-        )
-        print(
-            f"Parsed midi ports: inputs={self.midi_inputs}, outputs={self.midi_outputs}"
+    def _load_ports(self) -> None:
+        """Load audio/MIDI ports and control metadata in one pass over effect data."""
+        ports: Mapping = self._effect_data.get("ports", {})
+        disabled = (
+            self._config.disable_ports if self._config is not None else frozenset()
         )
-
-
-    def _load_controls(self) -> None:
-        """Load control metadata from effect_get response."""
-        controls = parse_control_ports(self._effect_data)
-        self._controls = {c.symbol: c for c in controls}
+        prefix = self.label + "/"
+        # Control schema is per URI: parse once, copy for further instances
+        schema = _get_schema(self.client, self.uri)
+        parsed: list[ControlPort] | None = [] if schema is None else None
+
+        for kind, by_direction in ports.items():
+            for direction, items in by_direction.items():
+                if kind == "control":
+                    if direction == "input" and parsed is not None:
+                        parsed.extend(
+                            ControlPort.from_dict(p)
+                            for p in items
+                            if p.get("valid", True)
+                        )
+                    continue
+
+                attr = _PORT_ATTRS.get((kind, direction))
+                if attr is None:
+                    continue  # cv тощо не маршрутизуємо
+                target: list[Port] = getattr(self, attr)
+                for p in items:
+                    symbol = sys.intern(p["symbol"])
+                    if symbol in disabled:
+                        continue
+                    target.append(
+                        Port(
+                            symbol=symbol,
+                            name=p.get("name", symbol),
+                            graph_path=sys.intern(prefix + symbol),
+                        )
+                    )
+
+        if schema is None:
+            prototypes = tuple(parsed or ())
+            index = {c.symbol: i for i, c in enumerate(prototypes)}
+            schema = (prototypes, index)
+            # без "ports" (effect_get не вдався) схему не кешуємо: наступний
+            # екземпляр спробує ще раз замість назавжди порожніх контролів
+            if "ports" in self._effect_data:
+                _store_schema(self.client, self.uri, schema)
+        prototypes, self._control_index = schema
+        self._control_list = [c.copy() for c in prototypes]
+        self._controls_view = _ControlsView(self._control_index, self._control_list)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Parsed audio ports: inputs=%s, outputs=%s",
+                self.audio_inputs,
+                self.audio_outputs,
+            )
+            log.debug(
+                "Parsed midi ports: inputs=%s, outputs=%s",
+                self.midi_inputs,
+                self.midi_outputs,
+            )
 
     # --- Dict-like access to control values ---
 
     @property
-    def controls(self):
-        return self._controls
+    def controls(self) -> Mapping[str, ControlPort]:
+        """Live read-only view: symbol -> ControlPort."""
+        return self._controls_view
 
-    def keys(self):
-        return self._controls.keys()
+    def keys(self) -> KeysView[str]:
+        return self._controls_view.keys()
 
-    def values(self):
-        return self._controls.values()
+    def values(self) -> ValuesView[ControlPort]:
+        return self._controls_view.values()
 
-    def items(self):
-        return self._controls.items()
+    def items(self) -> ItemsView[str, ControlPort]:
+        return self._controls_view.items()
 
     def __getitem__(self, symbol: str) -> ControlPort:
         """Get current cached control value."""
-        if symbol not in self._controls:
-            raise KeyError(
-                f"Control '{symbol}' not found. Available: {list(self._controls.keys())}"
-            )
-        return self._controls[symbol]
+        try:
+            return self._control_list[self._control_index[symbol]]
+        except KeyError:
+            raise _ControlNotFound(symbol, self._control_index) from None
 
     def __contains__(self, symbol: str) -> bool:
-        return symbol in self._controls
+        return symbol in self._control_index
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._controls)
+        return iter(self._control_index)
 
     # --- Convenience methods ---
 
@@ -215,26 +412,46 @@ class Plugin:
         return self._bypassed
 
     def bypass(self, bypass: bool = True) -> bool:
-        """Enable/disable bypass for this plugin. Set bypass via Client API."""
-        self.client.ws.effect_bypass(self.label, bypass)
+        """Enable/disable bypass for this plugin. HTTP only if WS send fails."""
+        if self.client.ws.effect_bypass(self.label, bypass):
+            return True
         return self.client.effect_bypass(self.label, bypass)
 
-    def param_set(self, symbol: str, value: float) -> bool:
-        """Set parameter via Client API."""
-        if symbol not in self._controls:
-            raise KeyError(
-                f"Control '{symbol}' not found. Available: {list(self._controls.keys())}"
-            )
+    def param_set(self, symbol: str, value: float, immediate: bool = False) -> bool:
+        """Set parameter via Client API.
 
-        # Sync to API via POST
-        self.client.ws.effect_param_set(self.label, symbol, value)
+        The local value updates at once. Sends are coalesced per
+        (plugin, symbol) within PARAM_SET_INTERVAL, so a tight loop of
+        calls sends only the latest value; True then means "queued" and
+        send failures are logged. immediate=True (or an interval of 0)
+        sends synchronously and returns whether the send succeeded.
+        """
+        self[symbol].value = value
+        self._repr_cache = None
+        if immediate or self.PARAM_SET_INTERVAL <= 0:
+            return self._send_param(symbol, value)
+        _param_coalescer.submit(self, symbol, value)
+        return True
+
+    def _send_param(self, symbol: str, value: float) -> bool:
+        # WS is authoritative (server echoes param_set); POST is the fallback
+        if self.client.ws.effect_param_set(self.label, symbol, value):
+            return True
         return self.client.effect_param_set(self.label, symbol, value)
 
     def set_cached_value(self, symbol: str, value: float) -> None:
         """Set control value locally without API call (for WS sync)."""
-        if symbol in self._controls:
-            self._controls[symbol].value = value
+        i = self._control_index.get(symbol)
+        if i is not None:
+            self._control_list[i].value = value
+            self._repr_cache = None
 
     def __repr__(self) -> str:
-        items = [f"{k}={v.format_value()}" for k, v in self._controls.items()]
-        return f"Plugin({self.label}, controls={', '.join(items)})"
+        # cached until a value changes through param_set/set_cached_value
+        if self._repr_cache is None:
+            items = [f"{c.symbol}={c.format_value()}" for c in self._control_list]
+            self._repr_cache = f"Plugin({self.label}, controls={', '.join(items)})"
+        return self._repr_cache
+
+
+_param_coalescer = _ParamCoalescer()
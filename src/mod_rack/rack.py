@@ -1,13 +1,17 @@
+from bisect import bisect_right
 from enum import Enum, auto
+from functools import lru_cache
 import io
+import logging
+from itertools import accumulate, chain, count, islice
 import threading
-import time
-from typing import Any, Callable, SupportsIndex, TypeAlias
+from typing import Any, Callable, Iterator, Sequence, SupportsIndex, TypeAlias
 
 import secrets
-import string
 import weakref
 
+import requests
+
 from mod_rack.config import Config, HardwareConfig, PluginConfig, RoutingMode
 from mod_rack.client import (
     GraphAddHwPortEvent,
@@ -47,12 +51,26 @@ __all__ = [
     "RoutingManager",
 ]
 
+log = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Slots
 # =============================================================================
 
 
+# Position deltas below this are treated as the same place (float noise)
+POS_TOLERANCE = 1.0
+
+
+@lru_cache(maxsize=256)
+def _label_from_uri(uri: str) -> str:
+    # pure in uri; presets repeat the same plugin types
+    path = uri.split("#")[0].rstrip("/")
+    label = path.split("/")[-1]
+    return label.replace("#", "_").replace(" ", "_")
+
+
 class PluginSlot:
     """
     Слот для плагіна в ланцюгу ефектів.
@@ -61,6 +79,16 @@ class PluginSlot:
     Slot ідентифікується по label плагіна.
     """
 
+    __slots__ = (
+        "plugin",
+        "pos_x",
+        "pos_y",
+        "_audio_in_cache",
+        "_audio_out_cache",
+        "_midi_in_cache",
+        "_midi_out_cache",
+    )
+
     def __init__(self, plugin: Plugin, pos_x: float = 0, pos_y: float = 0):
         """
         Створює слот з плагіном.
@@ -70,8 +98,13 @@ class PluginSlot:
             plugin: Плагін (обов'язковий)
         """
         self.plugin = plugin
-        self.pos_x: float = pos_x
-        self.pos_y: float = pos_y
+        self.pos_x: float = pos_x if pos_x is not None else 0.0
+        self.pos_y: float = pos_y if pos_y is not None else 0.0
+        # graph_path кортежі портів; порти плагіна після завантаження не змінюються
+        self._audio_in_cache: tuple[str, ...] | None = None
+        self._audio_out_cache: tuple[str, ...] | None = None
+        self._midi_in_cache: tuple[str, ...] | None = None
+        self._midi_out_cache: tuple[str, ...] | None = None
 
     @property
     def label(self) -> str:
@@ -79,20 +112,35 @@ class PluginSlot:
         return self.plugin.label
 
     @property
-    def audio_inputs(self) -> list[str]:
-        return [p.graph_path for p in self.plugin.audio_inputs]
+    def audio_inputs(self) -> tuple[str, ...]:
+        if self._audio_in_cache is None:
+            self._audio_in_cache = tuple(p.graph_path for p in self.plugin.audio_inputs)
+        return self._audio_in_cache
 
     @property
-    def audio_outputs(self) -> list[str]:
-        return [p.graph_path for p in self.plugin.audio_outputs]
+    def audio_outputs(self) -> tuple[str, ...]:
+        if self._audio_out_cache is None:
+            self._audio_out_cache = tuple(
+                p.graph_path for p in self.plugin.audio_outputs
+            )
+        return self._audio_out_cache
 
     @property
-    def midi_inputs(self) -> list[str]:
-        return [p.graph_path for p in self.plugin.midi_inputs]
+    def midi_inputs(self) -> tuple[str, ...]:
+        if self._midi_in_cache is None:
+            self._midi_in_cache = tuple(p.graph_path for p in self.plugin.midi_inputs)
+        return self._midi_in_cache
 
     @property
-    def midi_outputs(self) -> list[str]:
-        return [p.graph_path for p in self.plugin.midi_outputs]
+    def midi_outputs(self) -> tuple[str, ...]:
+        if self._midi_out_cache is None:
+            self._midi_out_cache = tuple(p.graph_path for p in self.plugin.midi_outputs)
+        return self._midi_out_cache
+
+    def invalidate_ports(self) -> None:
+        """Drop cached port paths after the plugin's port lists change."""
+        self._audio_in_cache = self._audio_out_cache = None
+        self._midi_in_cache = self._midi_out_cache = None
 
     @property
     def join_audio_outputs(self) -> bool:
@@ -109,15 +157,12 @@ class PluginSlot:
     @staticmethod
     def _label_from_uri(uri: str) -> str:
         """Генерує базовий label з URI плагіна."""
-        path = uri.split("#")[0].rstrip("/")
-        label = path.split("/")[-1]
-        return label.replace("#", "_").replace(" ", "_")
+        return _label_from_uri(uri)
 
-    def is_pos_changed(self, new_pos: tuple[float, float]):
-        new_x, new_y = new_pos
-        old_x = self.pos_x
-        old_y = self.pos_y
-        return abs(old_x - new_x) >= 1.0 or abs(old_y - new_y) >= 1.0
+    def is_pos_changed(self, x: float, y: float) -> bool:
+        return (
+            abs(self.pos_x - x) >= POS_TOLERANCE or abs(self.pos_y - y) >= POS_TOLERANCE
+        )
 
     def __eq__(self, other):
         if not isinstance(other, PluginSlot):
@@ -134,6 +179,8 @@ class PluginSlot:
 class HardwareSlot:
     """Hardware I/O слот (capture/playback)."""
 
+    __slots__ = ("audio_ports", "midi_ports", "direction", "join_audio_ports", "label")
+
     def __init__(
         self,
         direction: PortDirection,
@@ -232,20 +279,24 @@ class GridLayoutManager:
         Y_THRESHOLD: Maximum Y difference to consider slots in the same row for sorting.
     """
 
-    X_STEP: float = 500.0
-    Y_STEP: float = 200.0
-    X_MIN_SPACING: float = 100.0
-    Y_MIN_SPACING: float = 50.0
-    BASE_X: float = 150.0
-    BASE_Y: float = 100.0
-    Y_THRESHOLD: float = 200.0
+    # Цілі пікселі: REST /effect/position приймає int, тож сітка без float
+    X_STEP: int = 500
+    Y_STEP: int = 200
+    X_MIN_SPACING: int = 100
+    Y_MIN_SPACING: int = 50
+    BASE_X: int = 150
+    BASE_Y: int = 100
+    Y_THRESHOLD: int = 200
+
+    # (fingerprint of the slots, rows as positions into them) of the last call
+    _rows_cache: tuple[tuple, tuple[tuple[int, ...], ...]] | None = None
 
     @classmethod
     def sort_slots(cls, slots: list[PluginSlot]) -> list[PluginSlot]:
         """Реюзимо кластеризацію для отримання плаского відсортованого списку."""
-        rows = cls.get_clustered_rows(slots)
-        # Просто "сплющуємо" список списків у один список
-        return [slot for row in rows for slot in row]
+        # Сплющуємо індекси рядів напряму, без проміжного списку списків
+        rows_idx = cls._row_indices(slots)
+        return [slots[i] for i in chain.from_iterable(rows_idx)]
 
     @classmethod
     def normalize(
@@ -254,39 +305,45 @@ class GridLayoutManager:
         if not slots:
             return {}
 
-        result = {}
-        # 1. Отримуємо не просто список, а список кластерів (рядів)
-        # Для цього нам треба трохи змінити або використати внутрішню логіку sort_slots
-        rows = cls.get_clustered_rows(slots)
+        # 1. Кластеризація та розкладка за один прохід: ряди як індекси у slots
+        # (з кешу sort_slots), без проміжних списків слотів
+        rows = cls._row_indices(slots)
+        # Словник будується за один прохід з генератора координат
+        return dict(cls._grid_positions(slots, rows))
 
+    @classmethod
+    def _grid_positions(
+        cls, slots: list[PluginSlot], rows: tuple[tuple[int, ...], ...]
+    ) -> Iterator[tuple[PluginSlot, tuple[int, int]]]:
         # Починаємо з 0
-        prev_y: float = 0.0
-        prev_h: float = 0.0
+        prev_y = 0
+        prev_h = 0
 
-        for row_idx, row_slots in enumerate(rows):
+        for row_idx, row in enumerate(rows):
             # Кожен кластер отримує свій фіксований Y
             y_offset = prev_y + prev_h
             y = cls.BASE_Y + max(row_idx * cls.Y_STEP, y_offset) + cls.Y_MIN_SPACING
 
-            # Сортуємо плагіни всередині ряду зліва направо
-            row_slots.sort(key=lambda s: s.pos_x or 0)
+            # Плагіни всередині ряду вже йдуть зліва направо (get_clustered_rows)
 
-            prev_w: float = 0.0
-            prev_x: float = 0.0
-            for col_idx, slot in enumerate(row_slots):
+            prev_w = 0
+            prev_x = 0
+            row_h = 0
+            for col_idx, i in enumerate(row):
+                slot = slots[i]
                 # Кожен плагін у ряду отримує свій X
                 x_offset = prev_x + prev_w
                 x = cls.BASE_X + max(col_idx * cls.X_STEP, x_offset) + cls.X_MIN_SPACING
-                result[slot] = (x, y)
+                yield slot, (x, y)
                 prev_x = x
-                prev_w, _ = slot.size
+                # size читаємо раз: ширина для сусіда, висота для ряду
+                prev_w, h = slot.size
+                if h > row_h:
+                    row_h = h
 
-            # Знаходимо найвищий плагін у поточному ряду
-            # s.size[1] — це висота (height)
+            # Найвищий плагін у поточному ряду задає відступ наступного
             prev_y = y
-            prev_h = max(s.size[1] for s in row_slots) if row_slots else 0
-
-        return result
+            prev_h = row_h
 
     @classmethod
     def move_slot(
@@ -323,92 +380,98 @@ class GridLayoutManager:
 
         return result
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized clustering (the fingerprint already guards staleness)."""
+        cls._rows_cache = None
+
     @classmethod
     def get_clustered_rows(cls, slots: list[PluginSlot]) -> list[list[PluginSlot]]:
         if not slots:
             return []
+        # свіжі списки: викликачі можуть змінювати ряди на місці
+        return [[slots[i] for i in row] for row in cls._row_indices(slots)]
+
+    @classmethod
+    def _row_indices(cls, slots: list[PluginSlot]) -> tuple[tuple[int, ...], ...]:
+        # sort_slots/normalize/move_slot кластеризують ті самі слоти кілька
+        # разів за цикл: повторний виклик з тими ж позиціями бере кеш
+        key = tuple((id(s), s.label, s.pos_x, s.pos_y) for s in slots)
+        cached = cls._rows_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        rows_idx = cls._cluster_indices(slots)
+        cls._rows_cache = (key, rows_idx)
+        return rows_idx
+
+    @classmethod
+    def _cluster_indices(cls, slots: list[PluginSlot]) -> tuple[tuple[int, ...], ...]:
+        """Rows of positions into slots, top to bottom, each left to right."""
 
         # 1. Сортуємо ВСІ слоти спочатку по Y, потім по X, потім по label.
         # Це гарантує детермінованість: при однакових координатах порядок не зміниться.
-        active = sorted(
-            slots,
-            key=lambda s: (
-                s.pos_y if s.pos_y is not None else 0,
-                s.pos_x if s.pos_x is not None else 0,
-                s.label,
-            ),
-        )
+        # Ключі будуються один раз, тож sort порівнює кортежі без Python-колбеків
+        # (pos_x/pos_y завжди числа: PluginSlot підставляє 0 замість None)
+        keyed = sorted((s.pos_y, s.pos_x, s.label, i) for i, s in enumerate(slots))
 
-        rows: list[list[PluginSlot]] = []
-        if not active:
-            return rows
+        rows: list[list[tuple[float, str, int]]] = []
+        if not keyed:
+            return ()
 
-        current_row = [active[0]]
+        current_row: list[tuple[float, str, int]] = []
+        row_anchor_y = keyed[0][0]  # Y першого елемента в ряду як "якір"
         rows.append(current_row)
+        threshold = cls.Y_THRESHOLD
 
-        # Використовуємо Y першого елемента в ряду як "якір"
-        row_anchor_y = active[0].pos_y
-
-        for i in range(1, len(active)):
-            slot = active[i]
-
-            # Порівнюємо не з середнім, а з якорем ряду.
-            # Додаємо невеликий запас (epsilon), щоб уникнути проблем з float
-            if abs(slot.pos_y - row_anchor_y) <= cls.Y_THRESHOLD:
-                current_row.append(slot)
-            else:
+        for y, x, label, i in keyed:
+            # Порівнюємо не з середнім, а з якорем ряду
+            if abs(y - row_anchor_y) > threshold:
                 # Початок нового ряду
-                current_row = [slot]
+                current_row = []
                 rows.append(current_row)
-                row_anchor_y = slot.pos_y
+                row_anchor_y = y
+            current_row.append((x, label, i))
 
         # 2. Додатково сортуємо кожен ряд по X, щоб нормалізація не "перемішувала" колонки
-        for row in rows:
-            row.sort(key=lambda s: (s.pos_x if s.pos_x is not None else 0, s.label))
-
-        return rows
+        return tuple(tuple(i for _, _, i in sorted(row)) for row in rows)
 
     @classmethod
     def get_insertion_coords(
         cls, slots: list[PluginSlot], index: int | None = None
-    ) -> tuple[float, float]:
+    ) -> tuple[int, int]:
         """
         Розраховує координати на основі візуальних рядів (кластерів).
         """
-        rows = cls.get_clustered_rows(slots)
-
-        # 1. Якщо немає слотів або вставка в самий кінець
-        if not rows or index is None or index >= sum(len(r) for r in rows):
-            row_idx = len(rows) - 1 if rows else 0
-            # Беремо останній ряд
-            target_row = rows[-1] if rows else []
-
-            # Якщо останній ряд не порожній, ставимо ПРАВОРУЧ від останнього
-            if target_row:
-                x = cls.BASE_X + len(target_row) * cls.X_STEP
-                y = cls.BASE_Y + (len(rows) - 1) * cls.Y_STEP
-            else:
-                x, y = cls.BASE_X, cls.BASE_Y
-
-            return (float(x), float(y))
-
-        # 2. Якщо вставка всередині (пошук конкретного ряду та колонки)
-        current_idx = 0
-        for row_idx, row_slots in enumerate(rows):
-            if current_idx <= index < current_idx + len(row_slots):
-                col_idx = index - current_idx
-                x = cls.BASE_X + col_idx * cls.X_STEP
-                y = cls.BASE_Y + row_idx * cls.Y_STEP
-                return (float(x), float(y))
-            current_idx += len(row_slots)
-
-        return (float(cls.BASE_X), float(cls.BASE_Y))
+        # Потрібні лише довжини рядів: беремо кешовані індекси, без списків слотів
+        rows = cls._row_indices(slots) if slots else ()
+
+        # 1. Якщо немає слотів або вставка в самий кінець (найчастіший випадок)
+        if not rows or index is None or index >= len(slots):
+            if not rows:
+                return (cls.BASE_X, cls.BASE_Y)
+            # Ставимо ПРАВОРУЧ від останнього в останньому ряду
+            return (
+                cls.BASE_X + len(rows[-1]) * cls.X_STEP,
+                cls.BASE_Y + (len(rows) - 1) * cls.Y_STEP,
+            )
+
+        # 2. Якщо вставка всередині: ряд шукаємо бінарно по префіксних сумах
+        # довжин рядів (кінці рядів у пласкому порядку)
+        if index < 0:
+            return (cls.BASE_X, cls.BASE_Y)
+        ends = list(accumulate(map(len, rows)))
+        row_idx = bisect_right(ends, index)
+        col_idx = index - (ends[row_idx - 1] if row_idx else 0)
+        return (
+            cls.BASE_X + col_idx * cls.X_STEP,
+            cls.BASE_Y + row_idx * cls.Y_STEP,
+        )
 
     @classmethod
-    def get_new_row_coords(cls, slots: list[PluginSlot]) -> tuple[float, float]:
+    def get_new_row_coords(cls, slots: list[PluginSlot]) -> tuple[int, int]:
         """Повертає координати для початку нового ряду (нижче всіх існуючих)."""
-        rows = cls.get_clustered_rows(slots)
-        return (float(cls.BASE_X), float(cls.BASE_Y + len(rows) * cls.Y_STEP))
+        n_rows = len(cls._row_indices(slots)) if slots else 0
+        return (cls.BASE_X, cls.BASE_Y + n_rows * cls.Y_STEP)
 
 
 # =============================================================================
@@ -425,8 +488,8 @@ class RoutingManager:
     @classmethod
     def get_connection_pairs(
         cls,
-        inputs: list[str],
-        outputs: list[str],
+        inputs: Sequence[str],
+        outputs: Sequence[str],
         joid_inputs: bool,
         joid_outputs: bool,
     ):
@@ -476,7 +539,7 @@ class RoutingManager:
         """Розраховує пари (вихід, вхід) між двома слотами."""
         outputs = src.midi_outputs
         inputs = dst.midi_inputs
-        print("MIDI!", inputs, outputs)
+        log.debug("MIDI pairs: inputs=%s outputs=%s", inputs, outputs)
         # Визначаємо прапори об'єднання (join)
         join_midi_outputs = True  # src.join_midi_outputs
         join_midi_inputs = True  # dst.join_midi_inputs
@@ -517,14 +580,12 @@ class RoutingManager:
         output_slot: HardwareSlot,
     ) -> set[tuple[str, str]]:
         """Повертає повний набір бажаних з'єднань для всього ланцюга."""
-        desired = set()
-        chain = [input_slot] + slots + [output_slot]
+        desired: set[tuple[str, str]] = set()
+        chain: list[AnySlot] = [input_slot, *slots, output_slot]
 
-        for i in range(len(chain) - 1):
-            audio_pairs = cls.get_audio_connection_pairs(chain[i], chain[i + 1])
-            midi_pairs = cls.get_midi_connection_pairs(chain[i], chain[i + 1])
-            desired.update(audio_pairs)
-            desired.update(midi_pairs)
+        for src, dst in zip(chain, islice(chain, 1, None)):
+            desired.update(cls.get_audio_connection_pairs(src, dst))
+            desired.update(cls.get_midi_connection_pairs(src, dst))
 
         return desired
 
@@ -536,17 +597,14 @@ class RoutingManager:
         output_slot: HardwareSlot,
     ) -> set[tuple[str, str]]:
         """Повертає повний набір з'єднань, прокидаючи сигнал крізь несумісні слоти."""
-        desired = set()
-        chain = [input_slot] + slots + [output_slot]
-
-        for i in range(len(chain)):
-            src = chain[i]
+        desired: set[tuple[str, str]] = set()
+        chain: list[AnySlot] = [input_slot, *slots, output_slot]
 
+        for i, src in enumerate(chain):
             # --- Робота з AUDIO ---
             if src.audio_outputs:
                 # Шукаємо наступний слот, у якого є хоча б один audio_input
-                for j in range(i + 1, len(chain)):
-                    dst = chain[j]
+                for dst in islice(chain, i + 1, None):
                     if dst.audio_inputs:
                         audio_pairs = cls.get_audio_connection_pairs(src, dst)
                         desired.update(audio_pairs)
@@ -555,8 +613,7 @@ class RoutingManager:
             # --- Робота з MIDI ---
             if src.midi_outputs:
                 # Шукаємо наступний слот, у якого є хоча б один midi_input
-                for j in range(i + 1, len(chain)):
-                    dst = chain[j]
+                for dst in islice(chain, i + 1, None):
                     if dst.midi_inputs:
                         midi_pairs = cls.get_midi_connection_pairs(src, dst)
                         desired.update(midi_pairs)
@@ -576,21 +633,19 @@ class RoutingManager:
         Аудіо-ланцюг будується тільки через аудіо-плагіни.
         Міді-ланцюг будується тільки через міді-плагіни.
         """
-        desired = set()
-        full_chain = [input_slot] + slots + [output_slot]
+        desired: set[tuple[str, str]] = set()
+        full_chain: list[AnySlot] = [input_slot, *slots, output_slot]
 
         # 1. Формуємо аудіо-магістраль
         audio_nodes = [s for s in full_chain if s.audio_inputs or s.audio_outputs]
-        for i in range(len(audio_nodes) - 1):
-            src, dst = audio_nodes[i], audio_nodes[i+1]
+        for src, dst in zip(audio_nodes, islice(audio_nodes, 1, None)):
             # З'єднуємо, якщо є що і куди з'єднувати
             if src.audio_outputs and dst.audio_inputs:
                 desired.update(cls.get_audio_connection_pairs(src, dst))
 
         # 2. Формуємо міді-магістраль
         midi_nodes = [s for s in full_chain if s.midi_inputs or s.midi_outputs]
-        for i in range(len(midi_nodes) - 1):
-            src, dst = midi_nodes[i], midi_nodes[i+1]
+        for src, dst in zip(midi_nodes, islice(midi_nodes, 1, None)):
             if src.midi_outputs and dst.midi_inputs:
                 desired.update(cls.get_midi_connection_pairs(src, dst))
 
@@ -619,10 +674,17 @@ class Orchestrator:
 
         # Locks and flags
         self._lock = threading.RLock()
-        self._reorder_timer: threading.Timer | None = None
         self._debounce_delay: float = 0.1
-        self._loading = True
-        self._normalizing = False
+        # One long-lived debounce thread instead of a Timer thread per event
+        self._reorder_event = threading.Event()
+        self._reorder_force = False
+        self._stop = threading.Event()
+        # Прапорці як Event, а не bool під _lock: WS-обробники читають їх без
+        # локу, а is_set() бачить усі зміни, зроблені до відповідного set()
+        # (важливо і для free-threaded CPython)
+        self._loading = threading.Event()
+        self._loading.set()
+        self._normalizing = threading.Event()
 
         # CallBacks
         self._order_change_listeners: set[OnRackOrderChangeCallbackRef] = set()
@@ -635,8 +697,31 @@ class Orchestrator:
             direction=PortDirection.OUTPUT, config=config.hardware
         )
         self.slots: list[PluginSlot] = []
+        # label -> position in self.slots; rebuilt by _reindex_slots() under _lock
+        self._slot_index: dict[str, int] = {}
         self._connections: set[tuple[str, str]] = set()
-
+        # Last computed routing and the chain structure it was computed for
+        self._last_chain_signature: tuple = ()
+        self._last_desired: frozenset[tuple[str, str]] = frozenset()
+        # Bumped on every change to _connections; with the chain signature it
+        # tells reconnect_seamless that the last diff is still empty
+        self._connections_rev = 0
+        self._synced_state: tuple | None = None
+        # (label, x, y) of every slot right after the last normalization pass
+        self._last_normalized_fp: tuple = ()
+        # (label, x, y) of every slot as of the end of the last reorder
+        self._pos_fingerprint: tuple | None = None
+        # label -> (label, x, y) already applied locally, sent by the reorder
+        # loop once the gesture settles (only the last position per label)
+        self._pending_positions: dict[str, tuple[str, float, float]] = {}
+        # label -> (uri, x, y) of plugins added while loading; loaded
+        # concurrently and subscribed in one batch at loading end
+        self._pending_adds: dict[str, tuple[str, float, float]] = {}
+
+        self._reorder_thread = threading.Thread(
+            target=self._reorder_loop, name="rack-reorder", daemon=True
+        )
+        self._reorder_thread.start()
         self._subscribe()
 
     def _fetch_config(self):
@@ -644,28 +729,46 @@ class Orchestrator:
         Config.parse(data.decode())
 
     @property
-    def normalizing(self):
-        return self._normalizing
+    def normalizing(self) -> bool:
+        return self._normalizing.is_set()
 
     @normalizing.setter
     def normalizing(self, value: bool):
-        self._normalizing = value
+        if value:
+            self._normalizing.set()
+        else:
+            self._normalizing.clear()
 
     def run(self):
+        """Connect and block until shutdown(); WS works on its own thread."""
         self.client.ws.connect()
-        while True:
-            time.sleep(1)
+        self._stop.wait()
+
+    def shutdown(self):
+        """Release a blocked run() and stop the reorder thread."""
+        self._stop.set()
+        self._reorder_event.set()  # розбудити цикл, щоб він побачив _stop
+        if threading.current_thread() is not self._reorder_thread:
+            self._reorder_thread.join(timeout=1.0)
 
     def on_rack_order_changed(self, cb: OnRackOrderChangeCallback):
         ref: OnRackOrderChangeCallbackRef
+        # A collected listener drops its own ref (set.discard is atomic)
+        on_dead = self._order_change_listeners.discard
         try:
-            ref = weakref.WeakMethod(cb)
+            ref = weakref.WeakMethod(cb, on_dead)
         except TypeError:
-            ref = weakref.ref(cb)
+            ref = weakref.ref(cb, on_dead)
 
         with self._lock:
             self._order_change_listeners.add(ref)
 
+    def off_rack_order_changed(self, cb: OnRackOrderChangeCallback):
+        with self._lock:
+            for ref in list(self._order_change_listeners):
+                if ref() == cb:
+                    self._order_change_listeners.discard(ref)
+
     def _subscribe(self):
         # Setup WebSocket callbacks BEFORE connecting so we don't miss initial messages
         self.client.ws.on(LoadingStartEvent, self._on_loading_start)
@@ -682,29 +785,53 @@ class Orchestrator:
 
     def _on_loading_start(self, event: LoadingStartEvent):
         with self._lock:
-            if not self._loading:
+            if not self._loading.is_set():
                 _Color.red("\u25a0 Reloading detected")
             _Color.yellow("\u25f7 Loading start, initializing...")
-            self._loading = True
-            self._normalizing = False
+            self._loading.set()
+            self._normalizing.clear()
             self.slots.clear()
+            self._slot_index.clear()
             self._connections.clear()
+            self._connections_rev += 1
+            self._pending_adds.clear()
 
     def _on_loading_end(self, event: LoadingEndEvent):
         _Color.info("\u25cf Loading end, monitoring...")
         with self._lock:
-            self._loading = False
-        if not self._loading:
+            pending, self._pending_adds = self._pending_adds, {}
+
+        # метадані всіх плагінів пресету тягнемо паралельно, а не по одному
+        plugins = Plugin.load_many(
+            self.client,
+            [(uri, label) for label, (uri, _, _) in pending.items()],
+            self.config,
+            subscribe=False,
+        )
+        loaded: list[Plugin] = []
+        with self._lock:
+            for plugin, (label, (uri, x, y)) in zip(plugins, pending.items()):
+                if plugin is None:
+                    _Color.red(f"Can not load plugin: {label}, {uri}")
+                    continue
+                self.slots.append(PluginSlot(plugin, x, y))
+                self._slot_index[label] = len(self.slots) - 1
+                loaded.append(plugin)
+            self._loading.clear()
+        Plugin.subscribe_all(self.client, loaded)
+        if not self._loading.is_set():
             self._schedule_reorder(force_emit=True)
 
     def _on_reset_connections(self, event: ResetConnectionsEvent | Any):
         with self._lock:
             self._connections.clear()
+            self._connections_rev += 1
             self._schedule_reorder()
 
     def _on_remove_all(self, event: RemoveAllEvent | Any):
         with self._lock:
             self.slots.clear()
+            self._slot_index.clear()
             self._schedule_reorder()
 
     def _on_graph_hw_port_add(self, event: GraphAddHwPortEvent):
@@ -749,6 +876,16 @@ class Orchestrator:
         """
         _Color.blue(f"+ Plugin: {event.label}")
 
+        if self._loading.is_set():
+            # слот створиться пакетом у _on_loading_end
+            with self._lock:
+                self._pending_adds[event.label] = (
+                    event.uri,
+                    event.x if event.x is not None else 0,
+                    event.y if event.y is not None else 0,
+                )
+            return
+
         # Перевіряємо чи такий слот вже існує
         slot = self.get_slot_by_label(event.label)
         if not slot:
@@ -777,9 +914,9 @@ class Orchestrator:
         with self._lock:
             # Додаємо слот
             self.slots.append(slot)
+            self._slot_index[slot.label] = len(self.slots) - 1
 
-        if not self._loading:
-            self._schedule_reorder(force_emit=True)
+        self._schedule_reorder(force_emit=True)
 
     def _on_graph_plugin_remove(self, event: GraphPluginRemoveEvent):
         """
@@ -788,15 +925,20 @@ class Orchestrator:
         """
         _Color.red(f"- Plugin: {event.label}")
 
-        slot = self.get_slot_by_label(event.label)
-        if not slot:
-            return
-
         with self._lock:
-            self.slots.remove(slot)
-            print(f"  Removed slot: {event.label}")
-
-        if not self._loading:
+            if self._pending_adds.pop(event.label, None) is not None:
+                return
+            i = self.index_of(event.label)
+            if i is None:
+                return
+            del self.slots[i]
+            # лише хвіст зсувається: переіндексовуємо від i
+            self._slot_index.pop(event.label, None)
+            for j in range(i, len(self.slots)):
+                self._slot_index[self.slots[j].label] = j
+            log.debug("Removed slot: %s", event.label)
+
+        if not self._loading.is_set():
             self._schedule_reorder(force_emit=True)
 
     def _on_graph_connect(self, event: GraphConnectEvent):
@@ -805,14 +947,17 @@ class Orchestrator:
             pair = (event.src_path, event.dst_path)
             if pair not in self._connections:
                 self._connections.add(pair)
-                print(f"[Cache] Connected: {event.src_path} -> {event.dst_path}")
+                self._connections_rev += 1
+                log.debug("[Cache] Connected: %s -> %s", event.src_path, event.dst_path)
 
     def _on_graph_disconnect(self, event: GraphDisconnectEvent):
         _Color.red(f"\u22b6 Disconnected: {event.src_path} \u2307 {event.dst_path}")
         with self._lock:
             pair = (event.src_path, event.dst_path)
-            self._connections.discard(pair)
-            print(f"[Cache] Disconnected: {event.src_path} -> {event.dst_path}")
+            if pair in self._connections:
+                self._connections.remove(pair)
+                self._connections_rev += 1
+            log.debug("[Cache] Disconnected: %s -> %s", event.src_path, event.dst_path)
 
     def _on_position_change(self, event: GraphPluginPosEvent):
         _Color.yellow(f"\u2316 Pos: {event.label}, ({event.x}, {event.y})")
@@ -823,131 +968,262 @@ class Orchestrator:
         # Skip position updates during normalization (we're sending, not receiving)
         slot = self.get_slot_by_label(event.label)
         if not slot:
+            with self._lock:
+                pending = self._pending_adds.get(event.label)
+                if pending is not None:
+                    self._pending_adds[event.label] = (pending[0], event.x, event.y)
             return
 
         with self._lock:
             x, y = (event.x, event.y)
-            if slot.is_pos_changed((x, y)):
+            if slot.is_pos_changed(x, y):
                 _Color.yellow(f"\u21bb Syncing pos: {slot.label} to {(x, y)}")
                 slot.pos_x = x
                 slot.pos_y = y
 
-        if not self._loading and not self.normalizing:
+        if not self._loading.is_set() and not self.normalizing:
             self._schedule_reorder()
 
-    def _normalize_layout(self, /, force: bool = False):
-        if self._loading:
-            return
+    def _normalize_layout(self, /, force: bool = False) -> bool:
+        """False if the layout still needs a normalization pass (skipped/failed)."""
+        if self._loading.is_set():
+            return False
 
-        if self._normalizing:
-            return
+        if self._normalizing.is_set():
+            return False
 
         if self.mode != OrchestratorMode.MANAGER and not force:
-            return
+            return True
+
+        # Вже нормалізований стан (нічого не рухалось після нашого проходу)
+        fp = self._layout_fingerprint()
+        if fp == self._last_normalized_fp:
+            return True
 
         _Color.info("\u21bb Normalization...")
         new_positions = GridLayoutManager.normalize(self.slots)
-        self._request_update_positions(new_positions)
+        if not self._request_update_positions(new_positions):
+            return False
+        self._last_normalized_fp = self._layout_fingerprint()
+        return True
+
+    def _layout_fingerprint(self) -> tuple:
+        return tuple(
+            (s.label, round(s.pos_x, 1), round(s.pos_y, 1)) for s in self.slots
+        )
 
     def _request_update_positions(
-        self, positions: dict[PluginSlot, tuple[float, float]]
-    ):
+        self, positions: dict[PluginSlot, tuple[float, float]], /, defer: bool = False
+    ) -> bool:
+        """Apply positions locally and send the changed ones to the server.
+
+        With defer=True the send is left to the reorder loop, so a burst of
+        moves costs one batch with the final positions.
+        """
         self.normalizing = True
         try:
+            # Спершу локально, потім один пакет на сервер (label -> останні x, y)
+            changed: dict[str, tuple[str, float, float]] = {}
             for slot, (x, y) in positions.items():
-                old_pos = (slot.pos_x, slot.pos_y)
-                _Color.yellow(f"\u21c5 Updating pos: {old_pos} -> {(x, y)}")
-                if slot.is_pos_changed((x, y)):
+                old_x, old_y = slot.pos_x, slot.pos_y
+                # is_pos_changed inline: без кортежу та виклику методу на слот
+                tol = POS_TOLERANCE
+                if abs(old_x - x) >= tol or abs(old_y - y) >= tol:
+                    _Color.yellow(f"\u21c5 Updating pos: {(old_x, old_y)} -> {(x, y)}")
                     slot.pos_x = x
                     slot.pos_y = y
-                    self.client.effect_position(slot.label, x, y)
+                    changed[slot.label] = (slot.label, x, y)
+            if changed:
+                if defer:
+                    with self._lock:
+                        self._pending_positions.update(changed)
+                else:
+                    self.client.effect_position_many(changed.values())
+            return True
         except Exception as err:
             _Color.red(f"\u21c5 Updating pos: error occured: {err}")
+            return False
         finally:
-            with self._lock:
-                self.normalizing = False
+            self.normalizing = False
 
     def _reorder_slots_by_pos(self, /, force_emit=False):
+        with self._lock:
+            # Нічого не рухалось з минулого реордеру: порядок той самий
+            if not force_emit and self._pos_fingerprint == self._positions():
+                return
+
         with self._lock:
             # sort slots by pos
             old_order = [s.label for s in self.slots]
             self.slots = GridLayoutManager.sort_slots(self.slots)
+            self._reindex_slots()
             new_order = [s.label for s in self.slots]
 
         # then normalize
-        self._normalize_layout()
+        normalized = self._normalize_layout()
 
         with self._lock:
+            # після нормалізації: саме ці позиції бачитиме наступний виклик;
+            # якщо вона не вдалася, наступний реордер має спробувати знову
+            self._pos_fingerprint = self._positions() if normalized else None
             # check order changed
-            if old_order != new_order or force_emit or (not self.slots and old_order):
-                self.reconnect_seamless()
+            changed = (
+                old_order != new_order or force_emit or (not self.slots and old_order)
+            )
+
+        if changed:
+            # без локу: мережеві запити не блокують WS-потік
+            self.reconnect_seamless()
+            with self._lock:
                 self._order_changed_emit()
 
+    def _positions(self) -> tuple:
+        # точні координати: навіть малий зсув у ряду може змінити порядок
+        return tuple((s.label, s.pos_x, s.pos_y) for s in self.slots)
+
     def _schedule_reorder(self, /, force_emit: bool = False):
-        if self._reorder_timer:
-            self._reorder_timer.cancel()
-
-        # Таймер викличе реордер в окремому потоці через 200мс спокою
-        self._reorder_timer = threading.Timer(
-            self._debounce_delay,
-            self._reorder_slots_by_pos,
-            kwargs={"force_emit": force_emit},
-        )
+        with self._lock:
+            self._reorder_force |= force_emit
+        self._reorder_event.set()
+
+    def _reorder_loop(self):
+        event = self._reorder_event
+        stop = self._stop
+        while not stop.is_set():
+            event.wait()
+            # Реордер після self._debounce_delay спокою: кожна нова подія
+            # під час очікування відкладає його ще раз
+            while not stop.is_set():
+                event.clear()
+                if not event.wait(self._debounce_delay):
+                    break
+            if stop.is_set():
+                break
 
-        self._reorder_timer.start()
+            with self._lock:
+                force, self._reorder_force = self._reorder_force, False
+            try:
+                self._flush_positions()
+                self._reorder_slots_by_pos(force_emit=force)
+            except (OSError, LookupError, ValueError, RuntimeError) as err:
+                # мережа (requests.RequestException - це OSError) або гонка зі
+                # зміною слотів; цикл має жити до shutdown()
+                _Color.red(f"\u21c5 Reorder failed: {err}")
+
+    def _flush_positions(self):
+        with self._lock:
+            pending, self._pending_positions = self._pending_positions, {}
+            # слот могли видалити, поки позиція чекала
+            items = [p for p in pending.values() if p[0] in self._slot_index]
+        if items:
+            self.client.effect_position_many(items)
 
     def _order_changed_emit(self):
         _Color.info("\u21c5 Slots order changed")
         # then if order was changed process callbacks
-        dead = set()
-
-        for ref in self._order_change_listeners:
+        # (copy: a weakref callback may discard an entry meanwhile)
+        for ref in tuple(self._order_change_listeners):
             cb = ref()
-            if cb is None:
-                dead.add(ref)
-            else:
+            if cb is not None:
                 cb(self.slots)
 
-    def get_slot_by_label(self, label: str) -> PluginSlot | None:
-        """Find slot by its plugin label."""
-        for slot in self.slots:
+    def _reindex_slots(self):
+        self._slot_index = {slot.label: i for i, slot in enumerate(self.slots)}
+
+    def index_of(self, label: str) -> int | None:
+        """Position of the slot with given label in the chain."""
+        i = self._slot_index.get(label)
+        if i is None:
+            return None
+        slots = self.slots
+        if i < len(slots) and slots[i].label == label:
+            return i
+        # index is being rebuilt concurrently: fall back to a scan
+        for i, slot in enumerate(slots):
             if slot.label == label:
-                return slot
+                return i
         return None
 
+    def get_slot_by_label(self, label: str) -> PluginSlot | None:
+        """Find slot by its plugin label."""
+        i = self.index_of(label)
+        return self.slots[i] if i is not None else None
+
     # =========================================================================
     # Routing
     # =========================================================================
 
     def reconnect_seamless(self):
         """Синхронізує поточні з'єднання на сервері з розрахованим ідеалом."""
-        if self._loading:
+        if self._loading.is_set():
             return
 
         if self.mode != OrchestratorMode.MANAGER:
             return
 
+        # Під локом лише знімок стану: WS-події не чекають на мережу
         with self._lock:
             # 1. Отримуємо "ідеальний" стан від менеджера
-            desired = RoutingManager.calculate_chain_connections(
-                self.slots, self.input_slot, self.output_slot, self.config.rack.routing_mode
-            )
-
-            # 2. Обчислюємо різницю з кешем Orchestrator
-            to_connect = desired - self._connections
-            to_disconnect = self._connections - desired
-
-            if not to_connect and not to_disconnect:
-                return
-
-            _Color.info("--- Syncing Graph ---")
-            for out_p, in_p in to_connect:
-                self.client.effect_connect(out_p, in_p)
+            # (перераховуємо лише коли змінилась структура ланцюга)
+            desired = self._desired_connections()
+            state = (self._last_chain_signature, self._connections_rev)
+            if state == self._synced_state:
+                return  # ні ланцюг, ні з'єднання не змінились з останньої звірки
+            connections = frozenset(self._connections)
+
+        # 2. Обчислюємо різницю зі знімком кешу Orchestrator
+        # (відсортовано: детермінований порядок запитів і логів)
+        to_connect = sorted(desired - connections)
+        to_disconnect = sorted(connections - desired)
+
+        if not to_connect and not to_disconnect:
+            with self._lock:
+                self._synced_state = state
+            return
 
-            for out_p, in_p in to_disconnect:
-                self.client.effect_disconnect(out_p, in_p)
+        # _connections оновиться з WS-підтверджень (_on_graph_connect/disconnect)
+        _Color.info("--- Syncing Graph ---")
+        # спершу нові кабелі, потім старі геть: без розриву сигналу
+        if to_connect:
+            self.client.effect_connect_many(to_connect)
+        if to_disconnect:
+            self.client.effect_disconnect_many(to_disconnect)
+
+        log.debug("=== RECONNECT SEAMLESS DONE ===")
+
+    def _chain_signature(self) -> tuple:
+        """Everything the desired routing depends on; positions are not part of it."""
+        inp, out = self.input_slot, self.output_slot
+        return (
+            self.config.rack.routing_mode,
+            tuple(inp.audio_ports),
+            tuple(inp.midi_ports),
+            tuple((s.label, s.plugin.uri) for s in self.slots),
+            tuple(out.audio_ports),
+            tuple(out.midi_ports),
+        )
 
-        print("=== RECONNECT SEAMLESS DONE ===\n")
+    def _desired_connections(self) -> frozenset[tuple[str, str]]:
+        sig = self._chain_signature()
+        if sig != self._last_chain_signature:
+            desired = frozenset(
+                RoutingManager.calculate_chain_connections(
+                    self.slots,
+                    self.input_slot,
+                    self.output_slot,
+                    self.config.rack.routing_mode,
+                )
+            )
+            # Напр. переставили плагін без аудіо/міді портів: маршрути ті самі,
+            # тож звірка, підтверджена для старого ланцюга, лишається дійсною
+            synced = self._synced_state
+            if desired == self._last_desired:
+                desired = self._last_desired
+                if synced is not None and synced[0] == self._last_chain_signature:
+                    self._synced_state = (sig, synced[1])
+            self._last_desired = desired
+            self._last_chain_signature = sig
+        return self._last_desired
 
     def _connect_pair(self, src: AnySlot, dst: AnySlot):
         """Проксі-метод для точкового з'єднання (наприклад, при видаленні плагіна)."""
@@ -962,43 +1238,53 @@ class Orchestrator:
             if not self._connections:
                 return
 
-            print(f"  Disconnecting everything: {len(self._connections)} connections")
+            log.debug(
+                "Disconnecting everything: %d connections", len(self._connections)
+            )
+            pairs = list(self._connections)
 
-            # Копіюємо для ітерації
-            current_pairs = list(self._connections)
-            for out_path, in_path in current_pairs:
-                try:
-                    self.client.effect_disconnect(out_path, in_path)
-                except Exception as e:
-                    _Color.red(f"Error disconnecting {out_path} -> {in_path}: {e}")
+        # мережа без локу: WS-потік тим часом далі оновлює кеш
+        try:
+            results = self.client.effect_disconnect_many(pairs)
+        except (OSError, requests.RequestException) as e:
+            # кеш не чіпаємо: що встигло роз'єднатись, приберуть WS-події
+            _Color.red(f"Error disconnecting: {e}")
+            return
+
+        # З кешу прибираємо лише підтверджені пари; решта лишається, тож
+        # наступна синхронізація спробує ще раз
+        done = {pair for pair, ok in zip(pairs, results) if ok}
+        with self._lock:
+            if not done.isdisjoint(self._connections):
+                self._connections = self._connections - done
+                self._connections_rev += 1
 
     def clear(self):
         """Request removal of all plugins safely."""
         with self._lock:
             if not self.slots:
                 return
+            labels_to_remove = [slot.label for slot in self.slots]
 
-            _Color.info("--- Clearing Rack ---")
-
-            # 1. Зупиняємо моніторинг порядку на час масового видалення
-            # (необов'язково, але корисно мати прапор масової операції)
+        _Color.info("--- Clearing Rack ---")
 
-            # 2. Розірвати всі кабелі одним махом, щоб не було тріску
-            # при перепідключенні сусідів, які теж зараз зникнуть
-            self._disconnect_everything()
+        # 1. Зупиняємо моніторинг порядку на час масового видалення
+        # (необов'язково, але корисно мати прапор масової операції)
 
-            # 3. Видаляємо плагіни.
-            # Використовуємо прямий виклик client, щоб уникнути
-            # зайвої логіки "сусідів" у request_remove_plugin
-            labels_to_remove = [slot.label for slot in self.slots]
+        # 2. Розірвати всі кабелі одним махом, щоб не було тріску
+        # при перепідключенні сусідів, які теж зараз зникнуть
+        self._disconnect_everything()
 
-            for label in labels_to_remove:
-                self.client.effect_remove(label)
+        # 3. Видаляємо плагіни.
+        # Використовуємо прямий виклик client, щоб уникнути
+        # зайвої логіки "сусідів" у request_remove_plugin
+        # (мережа без локу, як і вище)
+        self.client.effect_remove_many(labels_to_remove)
 
-            self.client.reset()
+        self.client.reset()
 
-            # 4. Примусово оновлюємо стан, якщо хочемо миттєвої реакції
-            # Хоча WS-події прийдуть і самі запустять реордер.
+        # 4. Примусово оновлюємо стан, якщо хочемо миттєвої реакції
+        # Хоча WS-події прийдуть і самі запустять реордер.
 
 
 # =============================================================================
@@ -1020,18 +1306,23 @@ class Rack(Orchestrator):
         self, config: Config, mode: OrchestratorMode = OrchestratorMode.MANAGER
     ):
         super().__init__(config=config, mode=mode)
+        # Лічильник суфіксів з випадкового старту: унікальний у сесії без
+        # читання ентропії на кожен плагін, і не повторює мітки минулих сесій,
+        # що лишилися на сервері в pedalboard
+        self._label_counter = count(secrets.randbits(32))
 
     # =========================================================================
     # Request API (ініціювання без локальних змін)
     # =========================================================================
 
-    @staticmethod
-    def _generate_label(uri: str) -> str:
+    def _generate_label(self, uri: str) -> str:
         """Generate unique label for plugin."""
         base = PluginSlot._label_from_uri(uri)
-        alphabet = string.ascii_letters + string.digits
-        uid = "".join(secrets.choice(alphabet) for _ in range(8))
-        return f"{base}_{uid}"
+        while True:
+            # 8 hex chars, safe in /graph/ paths
+            label = f"{base}_{next(self._label_counter) & 0xFFFFFFFF:08x}"
+            if label not in self._slot_index:
+                return label
 
     def request_add_plugin(self, uri: str, x: int = 500, y: int = 400) -> str | None:
         """
@@ -1079,7 +1370,7 @@ class Rack(Orchestrator):
         # Calculate position for this index
         x, y = GridLayoutManager.get_insertion_coords(self.slots, insert_index)
 
-        return self.request_add_plugin(uri, x=int(x), y=int(y))
+        return self.request_add_plugin(uri, x=x, y=y)
 
     def request_remove_plugin(self, label: str) -> bool:
         """
@@ -1097,22 +1388,15 @@ class Rack(Orchestrator):
         Returns:
             True if remove requested successfully, False otherwise
         """
-        slot = self.get_slot_by_label(label)
-        if not slot:
+        idx = self.index_of(label)
+        if idx is None:
             print(f"Plugin {label} not found locally, cannot remove")
             return False
 
-        idx = self.slots.index(slot)
-
         # Find neighbors
-        src: AnySlot = self.input_slot
-        for s in self.slots[:idx]:
-            src = s
-
-        dst: AnySlot = self.output_slot
-        for s in self.slots[idx + 1 :]:
-            dst = s
-            break
+        slots = self.slots
+        src: AnySlot = slots[idx - 1] if idx > 0 else self.input_slot
+        dst: AnySlot = slots[idx + 1] if idx + 1 < len(slots) else self.output_slot
 
         # Pre-connect neighbors
         if src and dst:
@@ -1147,12 +1431,13 @@ class Rack(Orchestrator):
 
         print(f"Moving slot from idx {from_idx} to {to_idx}")
 
-        if self._loading:
+        if self._loading.is_set():
             return
 
         _Color.info("\u21c5 Reordering...")
         new_positions = GridLayoutManager.move_slot(self.slots, from_idx, to_idx)
-        self._request_update_positions(new_positions)
+        # На сервер піде лише фінальна позиція, коли реордер-цикл прокинеться
+        self._request_update_positions(new_positions, defer=True)
 
         # Force reordering schedule
         self._schedule_reorder()